@@ -0,0 +1,56 @@
+import argparse
+import sys
+import time
+
+sys.path.insert(0, "src")
+from annotation import WORKER_HASH_MB, annotate_games  # noqa: E402
+from core.pgn import PgnWriter, read_games  # noqa: E402
+from engine.search import SearchLimits  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Tags every move of PGN games as best, inaccuracy, mistake or blunder"
+    )
+    parser.add_argument("path", help="PGN file to annotate")
+    parser.add_argument("output", help="PGN file the annotated games are written to")
+    parser.add_argument("--depth", type=int, default=3, help="search depth of every position")
+    parser.add_argument("--hash", type=int, default=WORKER_HASH_MB, help="hash size in MB")
+    parser.add_argument("--processes", type=int, help="worker processes, CPU count by default")
+    args = parser.parse_args()
+    if args.depth < 1:
+        parser.error("depth must be at least 1")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    games = 0
+    plies = 0
+    invalid = 0
+    start = time.perf_counter()
+    with open(args.path, encoding="utf-8-sig", errors="replace") as file, PgnWriter(
+        args.output, append=False
+    ) as writer:
+        limits = SearchLimits(depth=args.depth)
+        for game, error in annotate_games(read_games(file), limits, args.processes, args.hash):
+            games += 1
+            plies += len(game.moves)
+            if error is not None:
+                invalid += 1
+                sys.stdout.write(f"{args.path}:{game.line_number}: game {games}: {error}\n")
+            writer.write(game)
+    elapsed = time.perf_counter() - start
+
+    sys.stdout.write(f"\nGames: {games}\n")
+    sys.stdout.write(f"Invalid: {invalid}\n")
+    sys.stdout.write(f"Plies: {plies}\n")
+    sys.stdout.write(f"Time: {elapsed:.3f} s\n")
+    sys.stdout.write(f"Positions/s: {plies / elapsed if elapsed else 0:.0f}\n")
+
+
+if __name__ == "__main__":
+    if sys.version_info < (3, 10):
+        print("This chess app requires Python 3.10 or newer.")
+        sys.exit(1)
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import sys
+import time
+
+sys.path.insert(0, "src")
+from core import move as mv  # noqa: E402
+from core.fen import STARTING_FEN  # noqa: E402
+from core.position import Position  # noqa: E402
+from engine.job import EngineProcess  # noqa: E402
+from engine.search import SearchLimits  # noqa: E402
+
+BENCH_FENS = [
+    STARTING_FEN,
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "r1bq1rk1/pp2bppp/2n1pn2/3p4/2PP4/2N1PN2/PP3PPP/R2QKB1R w KQ - 0 8",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measures time to depth and nodes per second of the engine"
+    )
+    parser.add_argument("depth", type=int, help="search depth in plies")
+    parser.add_argument("--workers", type=int, default=1, help="number of search processes")
+    parser.add_argument("--hash", type=int, default=64, help="transposition table size in MB")
+    parser.add_argument("--fen", action="append", help="FEN of a position, repeatable")
+    args = parser.parse_args()
+    if args.depth < 1:
+        parser.error("depth must be at least 1")
+    if args.workers < 1:
+        parser.error("workers must be at least 1")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    try:
+        positions = [Position.from_fen(text) for text in args.fen or BENCH_FENS]
+    except ValueError as error:
+        sys.exit(str(error))
+
+    engine = EngineProcess(args.hash, args.workers)
+    total_nodes = 0
+    total_time = 0.0
+    try:
+        for position in positions:
+            engine.clear()
+            start = time.perf_counter()
+            result = engine.search(position, SearchLimits(depth=args.depth))
+            elapsed = time.perf_counter() - start
+            total_nodes += result.nodes
+            total_time += elapsed
+            sys.stdout.write(
+                f"{position.fen()}\n  {mv.uci(result.move)} score {result.score} "
+                f"depth {result.depth} nodes {result.nodes} time {elapsed:.3f} s\n"
+            )
+    finally:
+        engine.close()
+
+    sys.stdout.write(f"\nWorkers: {args.workers}\n")
+    sys.stdout.write(f"Nodes: {total_nodes}\n")
+    sys.stdout.write(f"Time: {total_time:.3f} s\n")
+    sys.stdout.write(f"NPS: {total_nodes / total_time if total_time else 0:.0f}\n")
+
+
+if __name__ == "__main__":
+    if sys.version_info < (3, 10):
+        print("This chess app requires Python 3.10 or newer.")
+        sys.exit(1)
+    main()
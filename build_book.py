@@ -0,0 +1,40 @@
+import argparse
+import sys
+import time
+from collections.abc import Iterator
+
+sys.path.insert(0, "src")
+from core.pgn import PgnGame, read_games  # noqa: E402
+from engine.book import DEFAULT_BOOK_PLIES, build_book  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Builds a Polyglot opening book from PGN files")
+    parser.add_argument("paths", nargs="+", help="PGN files")
+    parser.add_argument("--output", default="book.bin", help="book file to write")
+    parser.add_argument(
+        "--plies", type=int, default=DEFAULT_BOOK_PLIES, help="moves taken from every game"
+    )
+    return parser.parse_args()
+
+
+def all_games(paths: list[str]) -> Iterator[PgnGame]:
+    for path in paths:
+        with open(path, encoding="utf-8-sig", errors="replace") as file:
+            yield from read_games(file)
+
+
+def main() -> None:
+    args = parse_args()
+    start = time.perf_counter()
+    entries = build_book(all_games(args.paths), args.output, args.plies)
+    elapsed = time.perf_counter() - start
+    sys.stdout.write(f"Entries: {entries}\n")
+    sys.stdout.write(f"Time: {elapsed:.3f} s\n")
+
+
+if __name__ == "__main__":
+    if sys.version_info < (3, 10):
+        print("This chess app requires Python 3.10 or newer.")
+        sys.exit(1)
+    main()
@@ -1,11 +1,13 @@
 import sys
 
 sys.path.insert(0, "src")
-from chess import Chess  # noqa: E402
 
 if __name__ == "__main__":
     if sys.version_info < (3, 10):
         print("This chess app requires Python 3.10 or newer.")
         sys.exit(1)
+    # Engine workers started by spawn import this module again, they must not open a window
+    from chess import Chess
+
     chess = Chess()
     chess.run()
@@ -0,0 +1,53 @@
+import argparse
+import sys
+import time
+
+sys.path.insert(0, "src")
+from core.fen import STARTING_FEN  # noqa: E402
+from core.perft import divide, perft  # noqa: E402
+from core.position import Position  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Counts leaf nodes of the legal move tree")
+    parser.add_argument("depth", type=int, help="search depth in plies")
+    parser.add_argument("--fen", default=STARTING_FEN, help="FEN of the root position")
+    parser.add_argument(
+        "--moves", nargs="*", default=[], help="UCI moves played from the root position"
+    )
+    parser.add_argument("--divide", action="store_true", help="print counts per root move")
+    args = parser.parse_args()
+    if args.depth < 1:
+        parser.error("depth must be at least 1")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    try:
+        position = Position.from_fen(args.fen)
+        for text in args.moves:
+            position.make_move(position.parse_uci(text))
+    except ValueError as error:
+        sys.exit(str(error))
+
+    start = time.perf_counter()
+    if args.divide:
+        counts = divide(position, args.depth)
+        for uci, count in sorted(counts.items()):
+            sys.stdout.write(f"{uci}: {count}\n")
+        nodes = sum(counts.values())
+    else:
+        nodes = perft(position, args.depth)
+    elapsed = time.perf_counter() - start
+
+    sys.stdout.write(f"\nNodes: {nodes}\n")
+    sys.stdout.write(f"Time: {elapsed:.3f} s\n")
+    sys.stdout.write(f"NPS: {nodes / elapsed if elapsed else 0:.0f}\n")
+
+
+if __name__ == "__main__":
+    if sys.version_info < (3, 10):
+        print("This chess app requires Python 3.10 or newer.")
+        sys.exit(1)
+    main()
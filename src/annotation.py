@@ -0,0 +1,163 @@
+"""
+Batch annotation of PGN games: every position is searched by a pool of processes
+and every move gets a comment with its quality and the evaluation.
+"""
+
+import multiprocessing as mp
+from collections import deque
+from collections.abc import Iterable, Iterator
+from multiprocessing.pool import AsyncResult
+
+from core import move as mv
+from core.notation import parse_san, san
+from core.pgn import PgnGame
+from core.pieces import WHITE
+from core.position import Position
+from engine.evaluate import MATE_SCORE
+from engine.search import SearchLimits
+from engine.worker import init_worker, worker_searcher
+
+BEST = "best"
+INACCURACY = "inaccuracy"
+MISTAKE = "mistake"
+BLUNDER = "blunder"
+# Lowest centipawn loss of every tag, from the worst
+THRESHOLDS = ((300, BLUNDER), (100, MISTAKE), (50, INACCURACY))
+# Mate scores are clamped, a lost mate still counts as a blunder but not more
+SCORE_LIMIT = 1000
+
+# Positions searched by one worker task, consecutive positions share their hash entries
+CHUNK_PLIES = 16
+# Chunks sent to the pool per worker before the oldest game has to be written,
+# enough to keep workers busy and few enough to keep memory flat
+CHUNKS_PER_WORKER = 4
+WORKER_HASH_MB = 16
+
+
+def evaluate_line(
+    fen: str, moves: list[str], first: int, limits: SearchLimits
+) -> list[tuple[int, str, str]]:
+    """
+    Returns score and best move UCI and SAN of every position from the first one after the moves.
+    All moves are played from the start, so repetitions of earlier positions are seen.
+    Scores are from the side to move point of view, best move is empty in final positions.
+    """
+    searcher = worker_searcher(WORKER_HASH_MB)
+    position = Position.from_fen(fen)
+    evaluations: list[tuple[int, str, str]] = []
+    for i in range(len(moves) + 1):
+        if i:
+            position.make_move(position.parse_uci(moves[i - 1]))
+        if i < first:
+            continue
+        legal_moves = position.legal_moves()
+        if not legal_moves:
+            evaluations.append((-MATE_SCORE if position.is_check() else 0, "", ""))
+            continue
+        result = searcher.search(position, limits)
+        best_san = san(position, result.move, legal_moves)
+        evaluations.append((result.score, mv.uci(result.move), best_san))
+    return evaluations
+
+
+def tag(loss: int) -> str:
+    """
+    Returns the tag of a move losing the centipawns compared to the best one
+    """
+    for threshold, name in THRESHOLDS:
+        if loss >= threshold:
+            return name
+    return BEST
+
+
+def comments(moves: list[str], evaluations: list[tuple[int, str, str]], white: bool) -> list[str]:
+    """
+    Returns comment of every UCI move of a game from evaluations of all its positions.
+    Moves are compared in UCI, which has one spelling per move unlike SAN.
+    """
+    result: list[str] = []
+    for i, played in enumerate(moves):
+        best_score, best_move, best_san = evaluations[i]
+        played_score = -evaluations[i + 1][0]
+        best_score = max(min(best_score, SCORE_LIMIT), -SCORE_LIMIT)
+        played_score = max(min(played_score, SCORE_LIMIT), -SCORE_LIMIT)
+        name = BEST if played == best_move else tag(best_score - played_score)
+        # Evaluation after the move from White point of view
+        white_score = played_score if white else -played_score
+        comment = f"{name} {white_score / 100:+.2f}"
+        if name != BEST:
+            comment += f", best {best_san}"
+        result.append(comment)
+        white = not white
+    return result
+
+
+def game_line(game: PgnGame) -> tuple[str, list[str]]:
+    """
+    Returns start FEN and UCI moves of the game.
+    Raises ValueError at the first illegal or unreadable move.
+    """
+    position = game.start_position()
+    fen = position.fen()
+    moves: list[str] = []
+    for ply, text in enumerate(game.moves):
+        try:
+            move = parse_san(position, text)
+        except ValueError as error:
+            raise ValueError(f"ply {ply + 1}: {error}") from None
+        moves.append(mv.uci(move))
+        position.make_move(move)
+    return fen, moves
+
+
+def annotate_games(
+    games: Iterable[PgnGame],
+    limits: SearchLimits,
+    processes: int | None = None,
+    memory_mb: int = WORKER_HASH_MB,
+) -> Iterator[tuple[PgnGame, str | None]]:
+    """
+    Yields games in input order with comments on every move, and the error of unreadable games.
+    Positions of several games are searched at once in chunks, only a bounded number
+    of chunks is pending, so memory doesn't grow with the number of games.
+    """
+    with mp.Pool(processes, initializer=init_worker, initargs=(memory_mb,)) as pool:
+        max_pending = CHUNKS_PER_WORKER * (processes or mp.cpu_count())
+        pending: deque[tuple[PgnGame, list[str], list[AsyncResult], str | None]] = deque()
+        pending_chunks = 0
+        for game in games:
+            try:
+                fen, moves = game_line(game)
+            except ValueError as error:
+                pending.append((game, [], [], str(error)))
+                # Counted as one chunk, so a long run of them behind a searched game is bounded
+                pending_chunks += 1
+            else:
+                # Every chunk gets the moves up to its last position, starting from the game start
+                tasks = [
+                    pool.apply_async(
+                        evaluate_line, (fen, moves[: first + CHUNK_PLIES - 1], first, limits)
+                    )
+                    for first in range(0, len(moves) + 1, CHUNK_PLIES)
+                ]
+                pending.append((game, moves, tasks, None))
+                pending_chunks += len(tasks)
+            # Unreadable games wait for nothing, they go out as soon as they are the oldest
+            while pending and (pending_chunks > max_pending or not pending[0][2]):
+                pending_chunks -= len(pending[0][2]) or 1
+                yield finish(*pending.popleft())
+        while pending:
+            yield finish(*pending.popleft())
+
+
+def finish(
+    game: PgnGame, moves: list[str], tasks: list[AsyncResult], error: str | None
+) -> tuple[PgnGame, str | None]:
+    """
+    Waits for the evaluations of the game and returns it with comments
+    """
+    if error is None:
+        evaluations = [evaluation for task in tasks for evaluation in task.get()]
+        white = game.start_position().turn == WHITE
+        game.comments = comments(moves, evaluations, white)
+    return game, error
@@ -1,4 +1,6 @@
+import platform
 from collections.abc import Sequence
+from datetime import date
 
 import pygame as pg
 from pygame.event import Event
@@ -10,35 +12,54 @@ from board.col import Col
 from board.coord import Coord
 from board.row import Row
 from board.square import Square
-from events import END_GAME, NEXT_ACTION, gen_event
-from game import Action, Player, game
+from core import move as mv
+from core.castling import CASTLING_MOVES
+from core.notation import san
+from core.pgn import PgnGame, PgnWriter
+from core.position import Position
+from engine.book import OpeningBook
+from engine.job import EngineProcess, SearchJob
+from engine.search import SearchLimits, SearchResult
+from events import END_GAME, ENGINE_MOVE, NEXT_ACTION, gen_event
+from game import game
 from pieces.bishop import Bishop
-from pieces.generator import Generator
-from pieces.king import King
+from pieces.generator import PIECE_CLASSES, Generator
 from pieces.knight import Knight
-from pieces.moves import (
-    BlackCaptures,
-    BlackDefendedSquares,
-    WhiteCaptures,
-    WhiteDefendedSquares,
-)
-from pieces.pawn import Pawn
 from pieces.piece import Piece
 from pieces.queen import Queen
 from pieces.rook import Rook
 from settings import Settings
+from state import Action, Player
 from transcript import GameMove
 
 
+def post_engine_move(job: SearchJob, result: SearchResult) -> None:
+    """
+    Posts the move found by the search job, called from its thread
+    """
+    pg.event.post(Event(ENGINE_MOVE, job=job, move=result.move))
+
+
 class Board(Group):
     """
-    Class representing the chessboard
+    Class representing the chessboard.
+    It renders the core Position and turns user clicks into its moves.
     """
 
     def __init__(self, *sprites: Sprite | Sequence[Sprite]) -> None:
         self.active = False
+        self.position = Position.initial()
+        self.engine: EngineProcess | None = None
+        self.engine_job: SearchJob | None = None
+        self.book = OpeningBook(Settings.ENGINE_BOOK_PATH) if Settings.ENGINE_BOOK_PATH else None
+        self.legal_moves: list[int] = []
+        self.moves: dict[tuple[int, int], list[int]] = {}
+        # Squares are kept in core square index order, so they also act as the mailbox
         self.squares: list[Square] = []
         self.pieces: list[Piece] = []
+        self.piece_mailbox: list[Piece | None] = [
+            None for _ in range(Settings.ROW_NUM * Settings.COL_NUM)
+        ]
         self.rows: list[Row] = []
         self.cols: list[Col] = []
         self.square_pressed: Square | None = None
@@ -54,13 +75,19 @@ class Board(Group):
         for piece in self.pieces:
             piece.kill()
         self.pieces.clear()
-        game.pieces.empty()
+        self.transcript.clear()
+        self.piece_selected = None
+        self.position = Position.initial()
+        self.cancel_engine_search()
+        if self.engine is not None:
+            self.engine.clear()
         self.reset_squares()
         pieces_gen = Generator(self.rows, self.cols)
-        self.pieces = pieces_gen.run()
-        game.pieces.add(self.pieces)
+        self.pieces = pieces_gen.run(self.position)
+        self.update_piece_mailbox()
         for piece in self.pieces:
             piece.setup()
+        self.update_possible_moves()
 
         game.setup()
 
@@ -70,10 +97,9 @@ class Board(Group):
         """
         self.setup_board()
 
-        game.squares.add(self.squares)
-        game.pieces.add(self.pieces)
         for piece in self.pieces:
             piece.setup()
+        self.update_possible_moves()
 
         game.setup()
 
@@ -91,7 +117,16 @@ class Board(Group):
                 self.squares.append(Square(Coord(row_i, col_i), self.rows[row_i], self.cols[col_i]))
         # Generate Pieces
         pieces_gen = Generator(self.rows, self.cols)
-        self.pieces = pieces_gen.run()
+        self.pieces = pieces_gen.run(self.position)
+        self.update_piece_mailbox()
+
+    def update_piece_mailbox(self) -> None:
+        """
+        Rebuilds the Piece mailbox from the Piece list
+        """
+        self.piece_mailbox = [None for _ in range(Settings.ROW_NUM * Settings.COL_NUM)]
+        for piece in self.pieces:
+            self.piece_mailbox[piece.coord.index] = piece
 
     def draw(self, surface: Surface) -> list[Rect]:
         game.screen.fill(Settings.BACKGROUND_COLOR)
@@ -102,79 +137,41 @@ class Board(Group):
             col.draw(surface)
         return super().draw(surface)
 
-    def get_square(self, obj: tuple[int, int] | Coord | Piece) -> Square | None:
+    def get_coord(self, pos: tuple[int, int]) -> Coord | None:
         """
-        Returns Square object from pos or coord or piece
+        Returns Coord of the Square under the pos or None if pos is outside the board
         """
-        for square in self.squares:
-            if isinstance(obj, tuple):
-                if square.full_rect.collidepoint(obj):
-                    return square
-            elif isinstance(obj, Coord):
-                if square.coord == obj:
-                    return square
-            else:
-                if square.coord == obj.coord:
-                    return square
+        col_i = (pos[0] - Settings.BORDER_LEN) // Settings.SQUARE_LEN
+        row_i = Settings.ROW_NUM - 1 - (pos[1] - Settings.BORDER_LEN) // Settings.SQUARE_LEN
+        if 0 <= row_i < Settings.ROW_NUM and 0 <= col_i < Settings.COL_NUM:
+            return Coord(row_i, col_i)
         return None
 
-    def get_piece(self, obj: tuple[int, int] | Coord | Square) -> Piece | None:
-        """
-        Returns Piece object from pos
-        """
-        for piece in self.pieces:
-            if isinstance(obj, tuple):
-                if piece.full_rect.collidepoint(obj):
-                    return piece
-            elif isinstance(obj, Coord):
-                if piece.coord == obj:
-                    return piece
-            else:
-                if piece.coord == obj.coord:
-                    return piece
-        return None
-
-    def get_defender_piece_en_passant(self, square: Square) -> Piece:
+    def get_square(self, obj: tuple[int, int] | Coord | Piece) -> Square | None:
         """
-        Returns defender Piece object during en passant
+        Returns Square object from pos or coord or piece
         """
-        for square_temp in self.squares:
-            for move in Pawn.pawn_directions_dict[game.state.player.value]:
-                if (square_temp.coord + move) == square.coord:
-                    piece = self.get_piece(square_temp)
-                    if piece:
-                        return piece
-        raise Exception("Impossible! Cannot find defender piece in en passant")
+        if isinstance(obj, tuple):
+            coord = self.get_coord(obj)
+            if coord is None:
+                return None
+            return self.squares[coord.index]
+        if isinstance(obj, Coord):
+            return self.squares[obj.index]
+        return self.squares[obj.coord.index]
 
-    def get_attackers(self, square: Square) -> list[Piece]:
-        """
-        Returns attackers (list of Pieces) of specified square
-        """
-        attackers: list[Piece] = []
-        capture_group_type = WhiteCaptures if game.state.player == Player.WHITE else BlackCaptures
-        for capture_group in square.groups():
-            if not isinstance(capture_group, capture_group_type):
-                continue
-            if not isinstance(capture_group.owner.sprite, Piece):
-                continue
-            attackers.append(capture_group.owner.sprite)
-        return attackers
-
-    def get_squares_between_king_and_attacker(self, king: King, attacker: Piece) -> list[Square]:
+    def get_piece(self, obj: tuple[int, int] | Coord | Square) -> Piece | None:
         """
-        Returns squares between king and attacker
+        Returns Piece object from pos or coord or square
         """
-        squares: list[Square] = []
-        # Can't block Knight attack
-        if isinstance(attacker, Knight):
-            return squares
-        coord = king.coord - attacker.coord
-        direction = coord.get_direction()
-        for square in attacker.move_square_generator(direction):
-            if self.get_piece(square):
-                break
-            squares.append(square)
-        return squares
+        if isinstance(obj, tuple):
+            coord = self.get_coord(obj)
+            if coord is None:
+                return None
+            return self.piece_mailbox[coord.index]
+        if isinstance(obj, Coord):
+            return self.piece_mailbox[obj.index]
+        return self.piece_mailbox[obj.coord.index]
 
     def actions(self, event: Event) -> None:
         if not self.active:
@@ -191,8 +188,20 @@ class Board(Group):
         # Actions "State Machine"
         if game.state.action == Action.SELECT:
             game.update_at_start_turn()
-            # Select a piece
-            if self.try_select_piece():
+            # Let the engine play or ...
+            if self.is_engine_turn():
+                if event.type == ENGINE_MOVE and event.job is self.engine_job:
+                    self.play_engine_move(event.move)
+                    self.set_next_action(Action.END_TURN)
+                elif self.engine_job is None:
+                    book_move = self.book_move()
+                    if book_move is None:
+                        self.start_engine_search()
+                    else:
+                        self.play_engine_move(book_move)
+                        self.set_next_action(Action.END_TURN)
+            # ... select a piece
+            elif self.try_select_piece():
                 self.set_next_action(Action.MOVE)
         elif game.state.action == Action.MOVE:
             # Change selected piece or ...
@@ -211,13 +220,30 @@ class Board(Group):
             # End turn
             self.set_next_action(Action.SELECT)
             self.perform_end_turn_calculations()
-            self.current_game_move.update_notation()
             self.transcript.append(self.current_game_move)
             game.end_player_turn(self.current_game_move.notation)
-            if game.state.checkmate or game.state.stalemate:
+            if game.state.end:
                 game.end_game()
+                if Settings.PGN_ARCHIVE_PATH:
+                    with PgnWriter(Settings.PGN_ARCHIVE_PATH) as writer:
+                        writer.write(self.pgn_game())
                 gen_event(END_GAME)
 
+    def pgn_game(self) -> PgnGame:
+        """
+        Returns the current game with its transcript and result as PGN game
+        """
+        tags = {
+            "Event": Settings.PGN_EVENT,
+            "Site": platform.node() or "?",
+            "Date": date.today().strftime("%Y.%m.%d"),
+            "Round": "-",
+            "White": Settings.PGN_WHITE_PLAYER,
+            "Black": Settings.PGN_BLACK_PLAYER,
+        }
+        moves = [game_move.notation for game_move in self.transcript]
+        return PgnGame(tags, moves, game.state.result)
+
     def set_next_action(self, action: Action) -> None:
         """
         Sets next action and generates dummy event.
@@ -231,22 +257,9 @@ class Board(Group):
         Performs all updates needed at the end of player turn
         """
         self.reset_squares()
-        self.update_pieces_flags()
-        self.update_pinned_pieces()
         self.update_possible_moves()
-        self.update_defended_squares()
+        self.update_game_end()
         self.update_king_check()
-        if self.current_game_move:
-            self.current_game_move.update_notation()
-        if game.state.check:
-            self.update_squares_between_king_and_attacker()
-            self.update_possible_moves_after_check()
-        self.update_kings_moves()
-        if not game.state.check:
-            self.update_king_stalemate()
-        if game.state.check:
-            self.update_kings_moves_after_check()
-            self.update_king_checkmate()
 
     def reset_squares(self) -> None:
         """
@@ -255,154 +268,89 @@ class Board(Group):
         for square in self.squares:
             square.turn_render_reset()
 
-    def update_pieces_flags(self) -> None:
-        """
-        Updates pieces flags of all Pieces
-        """
-        for piece in self.pieces:
-            piece.update_flags()
-
     def update_possible_moves(self) -> None:
         """
-        Updates possible moves and captures of all Pieces
+        Updates possible moves and captures of all Pieces from the core legal moves
         """
+        self.legal_moves = self.position.legal_moves()
+        self.moves.clear()
         for piece in self.pieces:
-            piece.update_moves()
-
-    def update_possible_moves_after_check(self) -> None:
-        """
-        Updates possible moves and captures of all Pieces after Check
-        """
-        for piece in self.pieces:
-            piece.update_moves_after_check()
+            piece.legal_moves.empty()
+            piece.captures.empty()
+        for move in self.legal_moves:
+            from_index, to_index = mv.from_square(move), mv.to_square(move)
+            owner = self.piece_mailbox[from_index]
+            square = self.squares[to_index]
+            if owner is None:
+                raise Exception("Impossible! Board sprites are out of sync with the position")
+            if self.position.is_capture(move):
+                owner.captures.add(square)
+            else:
+                owner.legal_moves.add(square)
+            self.moves.setdefault((from_index, to_index), []).append(move)
 
-    def update_kings_moves(self) -> None:
+    def update_king_check(self) -> None:
         """
-        Updates possible moves of Kings.
-        Used after update_checked_squares to remove checked squares from moves.
+        Marks the King Square when the check flag is set
         """
-        for piece in self.pieces:
-            if isinstance(piece, King):
-                piece.update_moves()
+        if not game.state.check:
+            return
+        king_index = self.position.king_square(self.position.turn)
+        king_square = self.get_square(Coord.from_index(king_index))
+        if not king_square:
+            raise Exception("Impossible! Cannot find Square of King object")
+        king_square.king_checked = True
 
-    def update_kings_moves_after_check(self) -> None:
+    def update_game_end(self) -> None:
         """
-        Updates possible moves of King after check.
-        Used after update_checked_squares to remove checked squares from moves.
+        Sets check, checkmate and draw flags according to current board state
         """
-        for piece in self.pieces:
-            if isinstance(piece, King):
-                piece.update_moves_after_check()
+        game.state.update_end(self.position, self.legal_moves)
 
-    def update_defended_squares(self) -> None:
-        """
-        Updates defended_by flag of all Squares
-        """
-        for square in self.squares:
-            square.defended_by.clear()
-            for group in square.groups():
-                if isinstance(group, WhiteDefendedSquares):
-                    square.defended_by.add(Player.WHITE)
-                elif isinstance(group, BlackDefendedSquares):
-                    square.defended_by.add(Player.BLACK)
+    def is_engine_turn(self) -> bool:
+        if game.state.player == Player.WHITE:
+            return Settings.ENGINE_PLAYS_WHITE
+        return Settings.ENGINE_PLAYS_BLACK
 
-    def update_pinned_pieces(self) -> None:
+    def book_move(self) -> int | None:
         """
-        Updates pinned flag of all Pieces
+        Returns a move of the opening book, None without a book or out of book
         """
-        for piece in self.pieces:
-            if piece.move_range < 8:
-                continue
-            for direction in piece.directions:
-                piece1: Piece | None = None
-                piece2: Piece | None = None
-                for square in piece.move_square_generator(direction):
-                    piece_target = self.get_piece(square)
-                    if not piece_target:
-                        continue
-                    # Can't pin own Pieces
-                    if piece.player == piece_target.player:
-                        break
-                    if piece1 is None:
-                        piece1 = piece_target
-                    else:
-                        piece2 = piece_target
-                        break
-                if isinstance(piece2, King) and piece1 is not None:
-                    piece1.pinned_directions.add(direction)
-                    piece1.pinned_directions.add(direction * Coord(-1, -1))
-                    piece1.pinned = True
+        if self.book is None:
+            return None
+        return self.book.choose(self.position)
 
-    def update_king_check(self) -> None:
+    def start_engine_search(self) -> None:
         """
-        Updates check flag according to current board state
+        Starts the engine search in its own process, the window keeps drawing meanwhile.
+        Found move comes back as ENGINE_MOVE event.
         """
-        game.state.check = False
-        game.king_attackers.empty()
-        game.is_knight_king_attacker = False
-        for piece in self.pieces:
-            if isinstance(piece, King):
-                king = piece
-                king_square = self.get_square(king)
-                if not king_square:
-                    raise Exception("Impossible! Cannot find Square of King object")
-                if king.player == game.state.player:
-                    # Can't check own King
-                    continue
-                king_square.king_checked = False
-                if game.state.player in king_square.defended_by:
-                    king_square.king_checked = True
-                    game.state.check = True
-                    attackers = self.get_attackers(king_square)
-                    game.is_knight_king_attacker = any(
-                        [isinstance(atk, Knight) for atk in attackers]
-                    )
-                    game.king_attackers.add(*attackers)
-
-    def update_squares_between_king_and_attacker(self) -> None:
-        """
-        Updates squares between king and attacker
-        """
-        game.squares_between_king_and_attacker.empty()
-        king_attackers: list[Piece] = [
-            sprite for sprite in game.king_attackers if isinstance(sprite, Piece)
-        ]
-        if len(king_attackers) > 1:
-            return
-        attacker = king_attackers[0]
-        king: King | None = None
-        for piece in self.pieces:
-            if not isinstance(piece, King):
-                continue
-            if piece.player == game.state.player:
-                continue
-            king = piece
-        if not king:
-            return
-        squares = self.get_squares_between_king_and_attacker(king, attacker)
-        game.squares_between_king_and_attacker.add(*squares)
+        if self.engine is None:
+            self.engine = EngineProcess(Settings.ENGINE_HASH_MB, Settings.ENGINE_WORKERS)
+        limits = SearchLimits(time=Settings.ENGINE_MOVE_TIME)
+        self.engine_job = SearchJob(self.engine, self.position, limits, post_engine_move)
+        self.engine_job.start()
 
-    def update_king_checkmate(self) -> None:
-        """
-        Sets checkmate flag according to current board state
-        """
-        game.state.checkmate = not self.opponent_has_legal_moves()
+    def cancel_engine_search(self) -> None:
+        if self.engine_job is not None:
+            self.engine_job.cancel()
+            self.engine_job = None
 
-    def update_king_stalemate(self) -> None:
-        """
-        Sets stalemate flag according to current board state
-        """
-        game.state.stalemate = not self.opponent_has_legal_moves()
+    def close_engine(self) -> None:
+        self.cancel_engine_search()
+        if self.engine is not None:
+            self.engine.close()
+            self.engine = None
 
-    def opponent_has_legal_moves(self) -> bool:
+    def play_engine_move(self, move: int) -> None:
         """
-        Returns True if opponent has legal moves. Otherwise returns False
+        Plays the move found by the engine
         """
-        for piece in self.pieces:
-            if piece.player.opponent() == game.state.player:
-                if len(piece.legal_moves) or len(piece.captures):
-                    return True
-        return False
+        self.engine_job = None
+        for square in self.squares:
+            square.render_reset()
+        self.piece_selected = None
+        self.push_move(move)
 
     def try_select_piece(self) -> bool:
         """
@@ -430,12 +378,7 @@ class Board(Group):
         for square in self.piece_selected.captures:
             if not isinstance(square, Square):
                 continue
-            if piece := self.get_piece(square):
-                if piece.player != self.piece_selected.player:
-                    square.render_possible_capture()
-            elif isinstance(self.piece_selected, Pawn):
-                if self.piece_selected.can_en_passant:
-                    self.piece_selected.en_passant_square.render_possible_capture()
+            square.render_possible_capture()
         return True
 
     def try_move_piece(self) -> bool:
@@ -458,27 +401,12 @@ class Board(Group):
             square.render_reset()
 
         self.square_selected = self.square_pressed
-        # Castling
-        if isinstance(self.piece_selected, King):
-            move = self.square_pressed.coord - self.piece_selected.coord
-            if (move / move.get_direction()).col_i > King.move_range:
-                direction = move.get_direction()
-                self.castle(self.piece_selected, self.square_selected, direction)
-                return True
-
-        # Pawn promotion
-        if isinstance(self.piece_selected, Pawn):
-            if self.square_selected.get_row().row_i == self.piece_selected.promotion_row:
-                self.promote_move(self.piece_selected, self.square_selected)
-                return True
-
-        # Move a piece to an empty square
-        self.move_piece(self.piece_selected, self.square_selected)
+        self.play_move(self.piece_selected, self.square_selected)
         return True
 
     def try_capture_piece(self) -> bool:
         """
-        Tries to capture a piece. If successful, returns True
+        Tries to capture a piece (en passant included). If successful, returns True
         """
         # Cannot capture if no piece is selected
         if self.piece_selected is None:
@@ -488,10 +416,6 @@ class Board(Group):
         if self.square_pressed is None:
             return False
 
-        # Cannot capture if no piece is pressed unless it's en passant
-        if self.piece_pressed is None:
-            return self.try_capture_en_passant()
-
         # Cannot capture if square is not in possible captures
         if self.square_pressed not in self.piece_selected.captures:
             return False
@@ -500,38 +424,9 @@ class Board(Group):
             square.render_reset()
 
         self.square_selected = self.square_pressed
-
-        # Pawn promotion
-        if isinstance(self.piece_selected, Pawn):
-            if self.square_selected.get_row().row_i == self.piece_selected.promotion_row:
-                self.promote_capture(self.piece_selected, self.piece_pressed)
-                return True
-
-        self.capture_piece(self.piece_selected, self.piece_pressed)
+        self.play_move(self.piece_selected, self.square_selected)
         return True
 
-    def try_capture_en_passant(self) -> bool:
-        """
-        Tries to capture en passant. If successful, returns True
-        """
-        # Only Pawns can en passant
-        if not isinstance(self.piece_selected, Pawn):
-            return False
-
-        # Square must be pressed
-        if self.square_pressed is None:
-            return False
-
-        if self.piece_selected.can_en_passant:
-            for pawn_capture in self.piece_selected.captures:
-                if not isinstance(pawn_capture, Square):
-                    continue
-                if pawn_capture.coord == self.square_pressed.coord:
-                    self.square_selected = self.square_pressed
-                    self.en_passant(self.piece_selected, self.square_selected)
-                    return True
-        return False
-
     def try_deselect_piece(self) -> bool:
         """
         Tries to deselect a piece. If successful, returns True
@@ -545,41 +440,68 @@ class Board(Group):
             return True
         return False
 
-    def move_piece(self, piece: Piece, square: Square) -> None:
+    def play_move(self, piece: Piece, square: Square) -> None:
+        """
+        Plays the move of a Piece to desired Square on the Position and updates sprites
+        """
+        moves = self.moves[(piece.coord.index, square.coord.index)]
+        move = moves[0]
+        if len(moves) > 1:
+            promotion_type = self.get_user_promotion_type().piece_type
+            move = next(move for move in moves if mv.promotion(move) == promotion_type)
+        self.push_move(move)
+
+    def push_move(self, move: int) -> None:
+        """
+        Plays the core move on the Position and updates sprites
+        """
+        piece = self.piece_mailbox[mv.from_square(move)]
+        square = self.squares[mv.to_square(move)]
+        if piece is None:
+            raise Exception("Impossible! Board sprites are out of sync with the position")
+        game.state.capture = self.position.is_capture(move)
+        self.current_game_move = GameMove(
+            piece, square, move, san(self.position, move, self.legal_moves)
+        )
+        if game.state.capture:
+            self.capture_piece(move)
+        if mv.flag(move) == mv.CASTLING:
+            self.castle(piece, square)
+        elif mv.promotion(move):
+            self.current_game_move.promotion_piece = self.promote(piece, square, move)
+        else:
+            self.move_piece(piece, square)
+        self.position.make_move(move)
+
+    def capture_piece(self, move: int) -> None:
         """
-        Moves a Piece to desired Square
+        Removes the Piece captured by the move
         """
-        self.current_game_move = GameMove(piece, square)
-        piece.move(square)
+        coord = Coord.from_index(mv.to_square(move))
+        if mv.flag(move) == mv.EN_PASSANT:
+            coord = Coord(Coord.from_index(mv.from_square(move)).row_i, coord.col_i)
+        defender = self.get_piece(coord)
+        if not defender:
+            raise Exception("Impossible! Cannot find captured Piece object")
+        self.remove_piece(defender)
 
-    def castle(self, king: Piece, king_dst_square: Square, direction: Coord) -> None:
+    def castle(self, king: Piece, king_dst_square: Square) -> None:
         """
         Castles
         """
-        rook: Rook | None = None
-        rook_dst_square: Square | None = None
-        for sprite in king.get_row():
-            if not isinstance(sprite, Rook):
+        for _, _, king_to, rook_from, rook_to, _ in CASTLING_MOVES[king.player.value]:
+            if king_to != king_dst_square.coord.index:
                 continue
-            if (
-                direction == Coord(0, 1)
-                and sprite.coord > king.coord
-                or direction == Coord(0, -1)
-                and sprite.coord < king.coord
-            ):
-                rook = sprite
-                rook_dst_square = self.get_square(king.coord + direction)
-        if rook is None:
-            raise Exception("Impossible that rook is None")
-        if abs((king.coord - rook.coord).col_i) > 3:
-            game.state.long_castle = True
-        else:
-            game.state.short_castle = True
-        if not rook_dst_square:
-            raise Exception("Impossible! Cannot find rook destination square during castling")
-        self.current_game_move = GameMove(king, king_dst_square)
-        king.move(king_dst_square)
-        rook.move(rook_dst_square)
+            rook = self.piece_mailbox[rook_from]
+            rook_dst_square = self.squares[rook_to]
+            if rook is None:
+                raise Exception("Impossible! Cannot find rook during castling")
+            if abs(rook_from - king.coord.index) > 3:
+                game.state.long_castle = True
+            else:
+                game.state.short_castle = True
+            self.move_piece(king, king_dst_square)
+            self.move_piece(rook, rook_dst_square)
 
     def get_user_promotion_type(self) -> type[Piece]:
         possible_promotion = {"Q": Queen, "R": Rook, "B": Bishop, "N": Knight}
@@ -588,62 +510,32 @@ class Board(Group):
             ...
         return possible_promotion[user_input]
 
-    def promote_move(self, pawn: Pawn, square: Square) -> None:
+    def promote(self, pawn: Piece, square: Square, move: int) -> Piece:
         """
-        Promotes Pawn by move
+        Promotes Pawn and returns the promotion Piece
         """
-        promotion_piece_type = self.get_user_promotion_type()
-        promotion_piece = promotion_piece_type(pawn.coord, pawn.player.value, *pawn.groups())
+        promotion_piece_type = PIECE_CLASSES[mv.promotion(move)]
+        promotion_piece = promotion_piece_type(pawn.coord, pawn.is_white, *pawn.groups())
         promotion_piece.setup()
-        game.pieces.add(promotion_piece)
         self.pieces.append(promotion_piece)
-        self.current_game_move = GameMove(pawn, square, promotion_piece)
         self.remove_piece(pawn)
-        promotion_piece.move(square)
-
-    def capture_piece(self, attacker: Piece, defender: Piece) -> None:
-        """
-        Attacker Piece captures the defender Piece
-        """
-        game.state.capture = True
-        defender_square = self.get_square(defender)
-        if not defender_square:
-            raise Exception("Impossible! Cannot find Square of Piece object")
-        self.current_game_move = GameMove(attacker, defender_square)
-        attacker.move(defender)
-        self.remove_piece(defender)
-
-    def en_passant(self, attacker: Piece, square: Square) -> None:
-        """
-        Performs an En Passant
-        """
-        game.state.capture = True
-        self.current_game_move = GameMove(attacker, square)
-        defender = self.get_defender_piece_en_passant(square)
-        attacker.move(square)
-        self.remove_piece(defender)
+        self.move_piece(promotion_piece, square)
+        return promotion_piece
 
-    def promote_capture(self, pawn: Pawn, defender: Piece) -> None:
+    def move_piece(self, piece: Piece, square: Square) -> None:
         """
-        Promotes Pawn by capture
+        Moves a Piece to desired Square keeping the Piece mailbox in sync
         """
-        promotion_piece_type = self.get_user_promotion_type()
-        promotion_piece = promotion_piece_type(pawn.coord, pawn.player.value, *pawn.groups())
-        promotion_piece.setup()
-        game.pieces.add(promotion_piece)
-        self.pieces.append(promotion_piece)
-        defender_square = self.get_square(defender)
-        if not defender_square:
-            raise Exception("Impossible! Cannot find Square of Piece object")
-        self.current_game_move = GameMove(pawn, defender_square, promotion_piece)
-        self.remove_piece(pawn)
-        promotion_piece.move(defender)
-        self.remove_piece(defender)
+        if self.piece_mailbox[piece.coord.index] is piece:
+            self.piece_mailbox[piece.coord.index] = None
+        piece.move(square)
+        self.piece_mailbox[square.coord.index] = piece
 
     def remove_piece(self, piece: Piece) -> None:
         """
         Removes Piece from board
         """
-        game.pieces.remove(piece)
+        if self.piece_mailbox[piece.coord.index] is piece:
+            self.piece_mailbox[piece.coord.index] = None
         self.pieces.remove(piece)
         piece.kill()
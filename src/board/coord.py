@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 import utils
+from settings import Settings
 
 
 @dataclass(frozen=True)
@@ -58,3 +59,14 @@ class Coord:
 
     def get_direction(self) -> "Coord":
         return self / abs(self)
+
+    @property
+    def index(self) -> int:
+        """
+        Square index used by the rules core
+        """
+        return self.row_i * Settings.COL_NUM + self.col_i
+
+    @classmethod
+    def from_index(cls, index: int) -> "Coord":
+        return cls(*divmod(index, Settings.COL_NUM))
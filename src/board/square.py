@@ -10,7 +10,7 @@ import utils
 from board.col import Col
 from board.coord import Coord
 from board.row import Row
-from game import Player, game
+from game import game
 from settings import Settings
 
 
@@ -30,7 +30,6 @@ class Square(Sprite):
         self.full_rect = self.get_full_rect()
         self.image = game.font.render("", True, Settings.BLACK_COLOR)
         self.rect = self.image.get_rect(center=self.full_rect.center)
-        self.defended_by: set[Player] = set()
 
         # Flags reset after turn
         self.king_checked = False
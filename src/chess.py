@@ -32,6 +32,7 @@ class Chess:
             self.update()
             pg.display.update()
             game.clock.tick(Settings.FPS)
+        self.board.close_engine()
         pg.quit()
 
     def actions(self) -> None:
@@ -0,0 +1,119 @@
+"""
+Bitboards are 64-bit ints with one bit per square, bit 0 = a1 and bit 63 = h8.
+"""
+
+from collections.abc import Iterator
+
+EMPTY_BB = 0
+FULL_BB = (1 << 64) - 1
+
+FILE_A = 0x0101010101010101
+FILE_B = FILE_A << 1
+FILE_G = FILE_A << 6
+FILE_H = FILE_A << 7
+RANK_1 = 0xFF
+RANK_2 = RANK_1 << 8
+RANK_3 = RANK_1 << 16
+RANK_6 = RANK_1 << 40
+RANK_7 = RANK_1 << 48
+RANK_8 = RANK_1 << 56
+
+NOT_FILE_A = FULL_BB ^ FILE_A
+NOT_FILE_H = FULL_BB ^ FILE_H
+NOT_FILE_AB = FULL_BB ^ (FILE_A | FILE_B)
+NOT_FILE_GH = FULL_BB ^ (FILE_G | FILE_H)
+
+BB_SQUARES = [1 << sq for sq in range(64)]
+
+
+def lsb(bb: int) -> int:
+    """
+    Returns index of the least significant bit
+    """
+    return (bb & -bb).bit_length() - 1
+
+
+def msb(bb: int) -> int:
+    """
+    Returns index of the most significant bit
+    """
+    return bb.bit_length() - 1
+
+
+def popcount(bb: int) -> int:
+    return bb.bit_count()
+
+
+def iter_squares(bb: int) -> Iterator[int]:
+    """
+    Generator for indexes of all set bits
+    """
+    while bb:
+        bit = bb & -bb
+        yield bit.bit_length() - 1
+        bb ^= bit
+
+
+def north(bb: int) -> int:
+    return (bb << 8) & FULL_BB
+
+
+def south(bb: int) -> int:
+    return bb >> 8
+
+
+def east(bb: int) -> int:
+    return (bb & NOT_FILE_H) << 1
+
+
+def west(bb: int) -> int:
+    return (bb & NOT_FILE_A) >> 1
+
+
+def north_east(bb: int) -> int:
+    return ((bb & NOT_FILE_H) << 9) & FULL_BB
+
+
+def north_west(bb: int) -> int:
+    return ((bb & NOT_FILE_A) << 7) & FULL_BB
+
+
+def south_east(bb: int) -> int:
+    return (bb & NOT_FILE_H) >> 7
+
+
+def south_west(bb: int) -> int:
+    return (bb & NOT_FILE_A) >> 9
+
+
+def knight_attacks(bb: int) -> int:
+    """
+    Returns squares attacked by knights on the bitboard
+    """
+    return (
+        ((bb & NOT_FILE_H) << 17)
+        | ((bb & NOT_FILE_A) << 15)
+        | ((bb & NOT_FILE_GH) << 10)
+        | ((bb & NOT_FILE_AB) << 6)
+        | ((bb & NOT_FILE_A) >> 17)
+        | ((bb & NOT_FILE_H) >> 15)
+        | ((bb & NOT_FILE_AB) >> 10)
+        | ((bb & NOT_FILE_GH) >> 6)
+    ) & FULL_BB
+
+
+def king_attacks(bb: int) -> int:
+    """
+    Returns squares attacked by kings on the bitboard
+    """
+    row = bb | east(bb) | west(bb)
+    return (row | north(row) | south(row)) ^ bb
+
+
+def pawn_attacks(bb: int, is_white: bool) -> int:
+    """
+    Returns squares attacked by pawns of the color on the bitboard
+    """
+    if is_white:
+        return north_east(bb) | north_west(bb)
+    return south_east(bb) | south_west(bb)
@@ -0,0 +1,32 @@
+"""
+Castling rights and castling moves of the rules core
+"""
+
+from core.pieces import BLACK, WHITE
+
+WHITE_SHORT = 1
+WHITE_LONG = 2
+BLACK_SHORT = 4
+BLACK_LONG = 8
+ALL_CASTLING = WHITE_SHORT | WHITE_LONG | BLACK_SHORT | BLACK_LONG
+
+# (right, king from, king to, rook from, rook to, squares that must be empty)
+CASTLING_MOVES = {
+    WHITE: (
+        (WHITE_SHORT, 4, 6, 7, 5, (5, 6)),
+        (WHITE_LONG, 4, 2, 0, 3, (1, 2, 3)),
+    ),
+    BLACK: (
+        (BLACK_SHORT, 60, 62, 63, 61, (61, 62)),
+        (BLACK_LONG, 60, 58, 56, 59, (57, 58, 59)),
+    ),
+}
+
+# Castling rights kept after a piece leaves or arrives at the square
+CASTLING_MASK = [ALL_CASTLING] * 64
+CASTLING_MASK[4] &= ~(WHITE_SHORT | WHITE_LONG)
+CASTLING_MASK[7] &= ~WHITE_SHORT
+CASTLING_MASK[0] &= ~WHITE_LONG
+CASTLING_MASK[60] &= ~(BLACK_SHORT | BLACK_LONG)
+CASTLING_MASK[63] &= ~BLACK_SHORT
+CASTLING_MASK[56] &= ~BLACK_LONG
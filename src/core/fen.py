@@ -0,0 +1,163 @@
+"""
+Forsyth-Edwards Notation of the rules core positions
+"""
+
+from typing import TYPE_CHECKING
+
+from core import zobrist
+from core.castling import (
+    BLACK_LONG,
+    BLACK_SHORT,
+    CASTLING_MOVES,
+    WHITE_LONG,
+    WHITE_SHORT,
+)
+from core.pieces import (
+    BLACK,
+    EMPTY,
+    KING,
+    PAWN,
+    PIECE_IDS,
+    PIECE_TYPE_BY_ID,
+    ROOK,
+    WHITE,
+    make_piece,
+    piece_color,
+    piece_type,
+)
+from core.squares import SQUARE_NAMES, col_of, parse_square, row_of, square
+
+if TYPE_CHECKING:
+    from core.position import Position
+
+STARTING_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+CASTLING_IDS = {"K": WHITE_SHORT, "Q": WHITE_LONG, "k": BLACK_SHORT, "q": BLACK_LONG}
+COLOR_IDS = {"w": WHITE, "b": BLACK}
+
+
+def piece_id(piece: int) -> str:
+    """
+    Returns FEN letter of the piece, uppercase for White
+    """
+    letter = PIECE_IDS[piece_type(piece)] or "P"
+    return letter if piece_color(piece) == WHITE else letter.lower()
+
+
+def parse_piece(letter: str) -> int:
+    """
+    Returns piece code of the FEN letter
+    """
+    ptype = PAWN if letter.upper() == "P" else PIECE_TYPE_BY_ID.get(letter.upper())
+    if ptype is None:
+        raise ValueError(f"Invalid piece letter: {letter!r}")
+    return make_piece(WHITE if letter.isupper() else BLACK, ptype)
+
+
+def set_fen(position: "Position", text: str) -> None:
+    """
+    Sets up the empty Position from the FEN.
+    Clocks may be omitted, they default to 0 and 1.
+    """
+    fields = text.split()
+    if len(fields) not in (4, 6):
+        raise ValueError(f"Invalid FEN, expected 4 or 6 fields: {text!r}")
+    placement, color, castling, ep_square = fields[:4]
+
+    rows = placement.split("/")
+    if len(rows) != 8:
+        raise ValueError(f"Invalid FEN, expected 8 rows: {text!r}")
+    for row_i, row in zip(range(7, -1, -1), rows):
+        col_i = 0
+        for letter in row:
+            if letter.isdigit():
+                col_i += int(letter)
+                continue
+            if col_i > 7:
+                raise ValueError(f"Invalid FEN, row {row!r} has more than 8 squares")
+            piece = parse_piece(letter)
+            if piece_type(piece) == PAWN and row_i in (0, 7):
+                raise ValueError(f"Invalid FEN, Pawn on the first or last row: {text!r}")
+            position.put_piece(square(row_i, col_i), piece)
+            col_i += 1
+        if col_i != 8:
+            raise ValueError(f"Invalid FEN, row {row!r} doesn't have 8 squares")
+    for color_i in (WHITE, BLACK):
+        if bin(position.bitboards[make_piece(color_i, KING)]).count("1") != 1:
+            raise ValueError(f"Invalid FEN, each side must have exactly one King: {text!r}")
+
+    if color not in COLOR_IDS:
+        raise ValueError(f"Invalid FEN side to move: {color!r}")
+    position.turn = COLOR_IDS[color]
+    if castling != "-":
+        for letter in castling:
+            if letter not in CASTLING_IDS:
+                raise ValueError(f"Invalid FEN castling rights: {castling!r}")
+            position.castling |= CASTLING_IDS[letter]
+    # Rights without King and Rook on their initial squares can't be used
+    for color_i, castling_moves in CASTLING_MOVES.items():
+        for right, king_from, _, rook_from, _, _ in castling_moves:
+            if position.board[king_from] != make_piece(color_i, KING) or position.board[
+                rook_from
+            ] != make_piece(color_i, ROOK):
+                position.castling &= ~right
+    if ep_square != "-":
+        position.ep_square = parse_square(ep_square)
+        if row_of(position.ep_square) != (5 if position.turn == WHITE else 2):
+            raise ValueError(f"Invalid FEN en passant square: {ep_square!r}")
+        # Pawn which just double pushed passed the square, coming from behind it
+        step = -1 if position.turn == WHITE else 1
+        col_i = col_of(position.ep_square)
+        pawn_sq = square(row_of(position.ep_square) + step, col_i)
+        start_sq = square(row_of(position.ep_square) - step, col_i)
+        if (
+            position.board[pawn_sq] != make_piece(position.turn ^ 1, PAWN)
+            or position.board[position.ep_square] != EMPTY
+            or position.board[start_sq] != EMPTY
+        ):
+            raise ValueError(f"Invalid FEN en passant square without a double push: {text!r}")
+    if len(fields) == 6:
+        try:
+            position.halfmove_clock = int(fields[4])
+            position.fullmove_number = int(fields[5])
+        except ValueError:
+            raise ValueError(f"Invalid FEN clocks: {text!r}") from None
+    position.key = zobrist.compute_key(position)
+
+
+def board_fen(position: "Position") -> str:
+    """
+    Returns the piece placement field of the FEN
+    """
+    rows: list[str] = []
+    for row_i in range(7, -1, -1):
+        row = ""
+        empty = 0
+        for col_i in range(8):
+            piece = position.board[square(row_i, col_i)]
+            if piece == EMPTY:
+                empty += 1
+                continue
+            if empty:
+                row += str(empty)
+                empty = 0
+            row += piece_id(piece)
+        if empty:
+            row += str(empty)
+        rows.append(row)
+    return "/".join(rows)
+
+
+def fen(position: "Position") -> str:
+    """
+    Returns the FEN of the Position
+    """
+    color = "w" if position.turn == WHITE else "b"
+    castling = "".join(
+        letter for letter, right in CASTLING_IDS.items() if position.castling & right
+    )
+    ep_square = "-" if position.ep_square is None else SQUARE_NAMES[position.ep_square]
+    return (
+        f"{board_fen(position)} {color} {castling or '-'} {ep_square} "
+        f"{position.halfmove_clock} {position.fullmove_number}"
+    )
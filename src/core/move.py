@@ -0,0 +1,66 @@
+"""
+Moves are encoded as ints:
+- bits 0-5: source square
+- bits 6-11: destination square
+- bits 12-14: promotion piece type
+- bits 15-16: special move flag
+"""
+
+from core.pieces import PIECE_IDS, PIECE_TYPE_BY_ID
+from core.squares import SQUARE_NAMES, parse_square
+
+NULL_MOVE = 0
+
+NORMAL = 0
+DOUBLE_PUSH = 1
+EN_PASSANT = 2
+CASTLING = 3
+
+
+def encode(from_sq: int, to_sq: int, promotion: int = 0, flag: int = NORMAL) -> int:
+    """
+    Returns move encoded as int
+    """
+    return from_sq | to_sq << 6 | promotion << 12 | flag << 15
+
+
+def from_square(move: int) -> int:
+    return move & 0x3F
+
+
+def to_square(move: int) -> int:
+    return move >> 6 & 0x3F
+
+
+def promotion(move: int) -> int:
+    return move >> 12 & 0x7
+
+
+def flag(move: int) -> int:
+    return move >> 15 & 0x3
+
+
+def uci(move: int) -> str:
+    """
+    Returns move in UCI notation\n
+    e.g 'e2e4', 'e7e8q'
+    """
+    if move == NULL_MOVE:
+        return "0000"
+    promotion_sign = PIECE_IDS[promotion(move)].lower() if promotion(move) else ""
+    return f"{SQUARE_NAMES[from_square(move)]}{SQUARE_NAMES[to_square(move)]}{promotion_sign}"
+
+
+def parse_uci(text: str) -> tuple[int, int, int]:
+    """
+    Returns source square, destination square and promotion piece type of UCI move.
+    Special flags are only known to the position, see Position.parse_uci.
+    """
+    if len(text) not in (4, 5):
+        raise ValueError(f"Invalid UCI move: {text!r}")
+    promotion_type = 0
+    if len(text) == 5:
+        if text[4].upper() not in PIECE_TYPE_BY_ID or text[4] in "kK":
+            raise ValueError(f"Invalid UCI promotion: {text!r}")
+        promotion_type = PIECE_TYPE_BY_ID[text[4].upper()]
+    return parse_square(text[0:2]), parse_square(text[2:4]), promotion_type
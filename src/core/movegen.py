@@ -0,0 +1,253 @@
+from typing import TYPE_CHECKING
+
+from core import move as mv
+from core.bitboard import (
+    BB_SQUARES,
+    FULL_BB,
+    RANK_1,
+    RANK_3,
+    RANK_6,
+    RANK_8,
+    iter_squares,
+    lsb,
+    north,
+    north_east,
+    north_west,
+    south,
+    south_east,
+    south_west,
+)
+from core.castling import CASTLING_MOVES
+from core.pieces import (
+    BISHOP,
+    BLACK,
+    KING,
+    KNIGHT,
+    PAWN,
+    PROMOTION_TYPES,
+    QUEEN,
+    ROOK,
+    WHITE,
+    make_piece,
+)
+from core.squares import col_of, row_of, square
+from core.tables import (
+    BETWEEN,
+    KING_ATTACKS,
+    KNIGHT_ATTACKS,
+    PAWN_ATTACKS,
+    bishop_attacks,
+    queen_attacks,
+    rook_attacks,
+)
+
+if TYPE_CHECKING:
+    from core.position import Position
+
+
+def attackers(position: "Position", sq: int, color: int, occupied: int) -> int:
+    """
+    Returns bitboard of pieces of the color attacking the square with given occupancy
+    """
+    bitboards = position.bitboards
+    queens = bitboards[make_piece(color, QUEEN)]
+    return (
+        (PAWN_ATTACKS[color ^ 1][sq] & bitboards[make_piece(color, PAWN)])
+        | (KNIGHT_ATTACKS[sq] & bitboards[make_piece(color, KNIGHT)])
+        | (KING_ATTACKS[sq] & bitboards[make_piece(color, KING)])
+        | (rook_attacks(sq, occupied) & (bitboards[make_piece(color, ROOK)] | queens))
+        | (bishop_attacks(sq, occupied) & (bitboards[make_piece(color, BISHOP)] | queens))
+    )
+
+
+def all_attackers(position: "Position", sq: int, occupied: int) -> int:
+    """
+    Returns bitboard of pieces of both colors attacking the square with given occupancy
+    """
+    return attackers(position, sq, WHITE, occupied) | attackers(position, sq, BLACK, occupied)
+
+
+def attacked_squares(position: "Position", color: int, occupied: int) -> int:
+    """
+    Returns bitboard of squares attacked by the color with given occupancy
+    """
+    bitboards = position.bitboards
+    pawns = bitboards[make_piece(color, PAWN)]
+    if color == WHITE:
+        attacked = north_east(pawns) | north_west(pawns)
+    else:
+        attacked = south_east(pawns) | south_west(pawns)
+    for sq in iter_squares(bitboards[make_piece(color, KNIGHT)]):
+        attacked |= KNIGHT_ATTACKS[sq]
+    for sq in iter_squares(bitboards[make_piece(color, KING)]):
+        attacked |= KING_ATTACKS[sq]
+    queens = bitboards[make_piece(color, QUEEN)]
+    for sq in iter_squares(bitboards[make_piece(color, BISHOP)] | queens):
+        attacked |= bishop_attacks(sq, occupied)
+    for sq in iter_squares(bitboards[make_piece(color, ROOK)] | queens):
+        attacked |= rook_attacks(sq, occupied)
+    return attacked
+
+
+def pin_masks(position: "Position", king_sq: int) -> dict[int, int]:
+    """
+    Returns squares of pieces pinned to own King mapped to the line they may move along
+    """
+    us = position.turn
+    them = us ^ 1
+    bitboards = position.bitboards
+    enemies = position.occupied_co[them]
+    queens = bitboards[make_piece(them, QUEEN)]
+    # Sliders which would see the King if own pieces were not on the board
+    snipers = (rook_attacks(king_sq, enemies) & (bitboards[make_piece(them, ROOK)] | queens)) | (
+        bishop_attacks(king_sq, enemies) & (bitboards[make_piece(them, BISHOP)] | queens)
+    )
+    masks: dict[int, int] = {}
+    for sniper_sq in iter_squares(snipers):
+        between = BETWEEN[king_sq][sniper_sq]
+        blockers = between & position.occupied
+        # Exactly one piece in between, it can only be own one
+        if blockers and not blockers & (blockers - 1):
+            masks[lsb(blockers)] = between | BB_SQUARES[sniper_sq]
+    return masks
+
+
+def legal_moves(position: "Position") -> list[int]:
+    """
+    Returns moves which don't leave own King in check.
+    Checkers, the capture or block mask and pins are computed once,
+    so every move is generated legal without being made.
+    """
+    moves: list[int] = []
+    us = position.turn
+    them = us ^ 1
+    bitboards = position.bitboards
+    occupied = position.occupied
+    own = position.occupied_co[us]
+    king_sq = position.king_square(us)
+
+    # King is removed from the occupancy, so it can't step back along a checking ray
+    danger = attacked_squares(position, them, occupied ^ BB_SQUARES[king_sq])
+    for to_sq in iter_squares(KING_ATTACKS[king_sq] & ~(own | danger)):
+        moves.append(mv.encode(king_sq, to_sq))
+
+    checkers = attackers(position, king_sq, them, occupied)
+    if checkers & (checkers - 1):
+        # Double check, only the King can move
+        return moves
+    if checkers:
+        check_mask = checkers | BETWEEN[king_sq][lsb(checkers)]
+    else:
+        check_mask = FULL_BB
+        add_castling_moves(position, moves, danger)
+
+    pins = pin_masks(position, king_sq)
+    pinned = 0
+    for pinned_sq in pins:
+        pinned |= BB_SQUARES[pinned_sq]
+    targets = check_mask & ~own
+
+    # Knight can never stay on the pin line
+    for from_sq in iter_squares(bitboards[make_piece(us, KNIGHT)] & ~pinned):
+        for to_sq in iter_squares(KNIGHT_ATTACKS[from_sq] & targets):
+            moves.append(mv.encode(from_sq, to_sq))
+    for ptype, slider_attacks in (
+        (BISHOP, bishop_attacks),
+        (ROOK, rook_attacks),
+        (QUEEN, queen_attacks),
+    ):
+        for from_sq in iter_squares(bitboards[make_piece(us, ptype)]):
+            mask = targets & pins[from_sq] if from_sq in pins else targets
+            for to_sq in iter_squares(slider_attacks(from_sq, occupied) & mask):
+                moves.append(mv.encode(from_sq, to_sq))
+
+    pawns = bitboards[make_piece(us, PAWN)]
+    add_pawn_moves(position, moves, pawns & ~pinned, check_mask, king_sq)
+    for from_sq in iter_squares(pawns & pinned):
+        add_pawn_moves(position, moves, BB_SQUARES[from_sq], check_mask & pins[from_sq], king_sq)
+    return moves
+
+
+def add_pawn_moves(
+    position: "Position", moves: list[int], pawns: int, target_mask: int, king_sq: int
+) -> None:
+    """
+    Extends moves by Pawn pushes, captures, en passant and promotions ending in the target mask.
+    All Pawns are shifted at once, the source square is recovered from the shift offset.
+    """
+    us = position.turn
+    empty = FULL_BB ^ position.occupied
+    enemies = position.occupied_co[us ^ 1]
+    if us == WHITE:
+        single = north(pawns) & empty
+        double = north(single & RANK_3) & empty
+        left, right = north_west(pawns), north_east(pawns)
+        push_offset, left_offset, right_offset = 8, 7, 9
+        promotion_rank = RANK_8
+    else:
+        single = south(pawns) & empty
+        double = south(single & RANK_6) & empty
+        left, right = south_west(pawns), south_east(pawns)
+        push_offset, left_offset, right_offset = -8, -9, -7
+        promotion_rank = RANK_1
+
+    for targets, offset in (
+        (single & target_mask, push_offset),
+        (left & enemies & target_mask, left_offset),
+        (right & enemies & target_mask, right_offset),
+    ):
+        for to_sq in iter_squares(targets & promotion_rank):
+            for promotion_type in PROMOTION_TYPES:
+                moves.append(mv.encode(to_sq - offset, to_sq, promotion_type))
+        for to_sq in iter_squares(targets & ~promotion_rank):
+            moves.append(mv.encode(to_sq - offset, to_sq))
+    for to_sq in iter_squares(double & target_mask):
+        moves.append(mv.encode(to_sq - 2 * push_offset, to_sq, flag=mv.DOUBLE_PUSH))
+
+    if position.ep_square is None:
+        return
+    ep_bb = BB_SQUARES[position.ep_square]
+    for targets, offset in ((left & ep_bb, left_offset), (right & ep_bb, right_offset)):
+        for to_sq in iter_squares(targets):
+            from_sq = to_sq - offset
+            if is_legal_en_passant(position, from_sq, to_sq, target_mask, king_sq):
+                moves.append(mv.encode(from_sq, to_sq, flag=mv.EN_PASSANT))
+
+
+def is_legal_en_passant(
+    position: "Position", from_sq: int, to_sq: int, target_mask: int, king_sq: int
+) -> bool:
+    """
+    Returns True if en passant doesn't leave own King in check.
+    Two Pawns leave the same row at once, so sliders are checked on the occupancy after capture.
+    """
+    captured_bb = BB_SQUARES[square(row_of(from_sq), col_of(to_sq))]
+    # Capture has to block the check or take the checking Pawn
+    if not (BB_SQUARES[to_sq] | captured_bb) & target_mask:
+        return False
+    occupied = (position.occupied ^ BB_SQUARES[from_sq] ^ captured_bb) | BB_SQUARES[to_sq]
+    them = position.turn ^ 1
+    bitboards = position.bitboards
+    queens = bitboards[make_piece(them, QUEEN)]
+    if rook_attacks(king_sq, occupied) & (bitboards[make_piece(them, ROOK)] | queens):
+        return False
+    if bishop_attacks(king_sq, occupied) & (bitboards[make_piece(them, BISHOP)] | queens):
+        return False
+    return True
+
+
+def add_castling_moves(position: "Position", moves: list[int], danger: int) -> None:
+    """
+    Extends moves by castling moves, danger is the bitboard of squares attacked by the opponent
+    """
+    us = position.turn
+    for right, king_from, king_to, _, _, empty_squares in CASTLING_MOVES[us]:
+        if not position.castling & right:
+            continue
+        if any(position.occupied & BB_SQUARES[sq] for sq in empty_squares):
+            continue
+        # King can't castle out of, through or into check
+        step = 1 if king_to > king_from else -1
+        if any(danger & BB_SQUARES[sq] for sq in range(king_from, king_to + step, step)):
+            continue
+        moves.append(mv.encode(king_from, king_to, flag=mv.CASTLING))
@@ -0,0 +1,159 @@
+import re
+
+from core import move as mv
+from core.pieces import PAWN, PIECE_IDS, PIECE_TYPE_BY_ID, piece_type
+from core.position import Position
+from core.squares import (
+    FILE_NAMES,
+    RANK_NAMES,
+    SQUARE_NAMES,
+    col_of,
+    parse_square,
+    row_of,
+)
+
+# Piece, source column, source row, capture, destination, promotion
+SAN_REGEX = re.compile(r"^([NBRQK])?([a-h])?([1-8])?(x)?([a-h][1-8])(?:=?([NBRQ]))?$")
+
+
+def group_moves(position: Position, legal_moves: list[int]) -> dict[tuple[int, int], list[int]]:
+    """
+    Returns legal moves grouped by moving piece type and destination in one pass.
+    Moves sharing a group are the only ones which need disambiguation.
+    """
+    groups: dict[tuple[int, int], list[int]] = {}
+    board = position.board
+    for move in legal_moves:
+        key = (piece_type(board[mv.from_square(move)]), mv.to_square(move))
+        groups.setdefault(key, []).append(move)
+    return groups
+
+
+def san_moves(position: Position, legal_moves: list[int] | None = None) -> dict[int, str]:
+    """
+    Returns every legal move mapped to its standard algebraic notation
+    """
+    if legal_moves is None:
+        legal_moves = position.legal_moves()
+    notations: dict[int, str] = {}
+    for group in group_moves(position, legal_moves).values():
+        for move in group:
+            notations[move] = san_body(position, move, group) + check_sign(position, move)
+    return notations
+
+
+def san(position: Position, move: int, legal_moves: list[int] | None = None) -> str:
+    """
+    Returns the move in standard algebraic notation.
+    Move must be legal in the position.
+    """
+    if legal_moves is None:
+        legal_moves = position.legal_moves()
+    key = (piece_type(position.board[mv.from_square(move)]), mv.to_square(move))
+    group = group_moves(position, legal_moves)[key]
+    return san_body(position, move, group) + check_sign(position, move)
+
+
+def san_body(position: Position, move: int, group: list[int]) -> str:
+    """
+    Returns standard algebraic notation of the move without check sign.
+    Group holds legal moves of the same piece type to the same destination.
+    """
+    from_sq = mv.from_square(move)
+    to_sq = mv.to_square(move)
+    if mv.flag(move) == mv.CASTLING:
+        return "O-O" if to_sq > from_sq else "O-O-O"
+    ptype = piece_type(position.board[from_sq])
+    capture_sign = "x" if position.is_capture(move) else ""
+    src_coord = ""
+    if ptype == PAWN:
+        if capture_sign:
+            src_coord = FILE_NAMES[col_of(from_sq)]
+    else:
+        src_coord = disambiguation(move, group)
+    promotion_sign = f"={PIECE_IDS[mv.promotion(move)]}" if mv.promotion(move) else ""
+    return f"{PIECE_IDS[ptype]}{src_coord}{capture_sign}{SQUARE_NAMES[to_sq]}{promotion_sign}"
+
+
+def check_sign(position: Position, move: int) -> str:
+    """
+    Returns '#' if the move mates, '+' if it checks, otherwise empty string
+    """
+    position.make_move(move)
+    sign = ""
+    if position.is_check():
+        sign = "#" if not position.legal_moves() else "+"
+    position.unmake_move()
+    return sign
+
+
+def disambiguation(move: int, group: list[int]) -> str:
+    """
+    Returns source column, row or both if other piece of the group
+    can reach the same destination
+    """
+    from_sq = mv.from_square(move)
+    ambiguous_row, ambiguous_col, ambiguous = False, False, False
+    for other in group:
+        other_from_sq = mv.from_square(other)
+        if other_from_sq == from_sq:
+            continue
+        ambiguous = True
+        if col_of(other_from_sq) == col_of(from_sq):
+            ambiguous_col = True
+        if row_of(other_from_sq) == row_of(from_sq):
+            ambiguous_row = True
+    if not ambiguous:
+        return ""
+    if not ambiguous_col:
+        return FILE_NAMES[col_of(from_sq)]
+    if not ambiguous_row:
+        return RANK_NAMES[row_of(from_sq)]
+    return SQUARE_NAMES[from_sq]
+
+
+def parse_san(position: Position, text: str, legal_moves: list[int] | None = None) -> int:
+    """
+    Returns legal move matching the standard algebraic notation.
+    Check signs and annotations are ignored, redundant disambiguation is accepted.
+    Capture sign must match the move and Pawn captures must name their source column.
+    """
+    if legal_moves is None:
+        legal_moves = position.legal_moves()
+    notation = text.rstrip("+#!?")
+    if notation in ("O-O", "O-O-O", "0-0", "0-0-0"):
+        short = len(notation) == 3
+        for move in legal_moves:
+            if mv.flag(move) != mv.CASTLING:
+                continue
+            if (mv.to_square(move) > mv.from_square(move)) == short:
+                return move
+        raise ValueError(f"Illegal move: {text!r}")
+
+    match = SAN_REGEX.match(notation)
+    if match is None:
+        raise ValueError(f"Invalid SAN move: {text!r}")
+    piece_id, src_col, src_row, capture_sign, destination, promotion_id = match.groups()
+    ptype = PIECE_TYPE_BY_ID[piece_id] if piece_id else PAWN
+    to_sq = parse_square(destination)
+    promotion_type = PIECE_TYPE_BY_ID[promotion_id] if promotion_id else 0
+    found = mv.NULL_MOVE
+    for move in group_moves(position, legal_moves).get((ptype, to_sq), []):
+        from_sq = mv.from_square(move)
+        # King steps of two squares are only written as castling
+        if mv.promotion(move) != promotion_type or mv.flag(move) == mv.CASTLING:
+            continue
+        if src_col is not None and FILE_NAMES[col_of(from_sq)] != src_col:
+            continue
+        if src_row is not None and RANK_NAMES[row_of(from_sq)] != src_row:
+            continue
+        if position.is_capture(move) != bool(capture_sign):
+            continue
+        if ptype == PAWN and capture_sign and src_col is None:
+            continue
+        if found != mv.NULL_MOVE:
+            raise ValueError(f"Ambiguous move: {text!r}")
+        found = move
+    if found == mv.NULL_MOVE:
+        raise ValueError(f"Illegal move: {text!r}")
+    return found
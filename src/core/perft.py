@@ -0,0 +1,32 @@
+from core import move as mv
+from core.position import Position
+
+
+def perft(position: Position, depth: int) -> int:
+    """
+    Returns number of leaf nodes of the legal move tree to the depth
+    """
+    if depth == 0:
+        return 1
+    moves = position.legal_moves()
+    # Bulk counting, leaves don't have to be made
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        position.make_move(move)
+        nodes += perft(position, depth - 1)
+        position.unmake_move()
+    return nodes
+
+
+def divide(position: Position, depth: int) -> dict[str, int]:
+    """
+    Returns perft leaf node count for every root move in UCI notation
+    """
+    counts: dict[str, int] = {}
+    for move in position.legal_moves():
+        position.make_move(move)
+        counts[mv.uci(move)] = perft(position, depth - 1) if depth > 1 else 1
+        position.unmake_move()
+    return counts
@@ -0,0 +1,219 @@
+"""
+Streaming reader and writer of PGN archives.
+Games are read and written one at a time, so memory use doesn't depend on the archive size.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from types import TracebackType
+
+from core.notation import parse_san
+from core.position import Position
+
+RESULTS = ("1-0", "0-1", "1/2-1/2", "*")
+# Tags exported first and always, in this order
+SEVEN_TAG_ROSTER = ("Event", "Site", "Date", "Round", "White", "Black", "Result")
+LINE_LENGTH = 80
+
+TAG_REGEX = re.compile(r'^\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+# Results go before move numbers, comment and variation delimiters are single tokens
+TOKEN_REGEX = re.compile(r"1-0|0-1|1/2-1/2|\*|\d+\.+|[{}();]|[^\s{}();]+")
+
+
+@dataclass
+class PgnGame:
+    tags: dict[str, str] = field(default_factory=dict)
+    moves: list[str] = field(default_factory=list)
+    result: str = "*"
+    line_number: int = 0
+    # Comment written after the move with the same index, empty for none
+    comments: list[str] = field(default_factory=list)
+
+    def start_position(self) -> Position:
+        """
+        Returns position from the FEN tag or the starting position
+        """
+        if "FEN" in self.tags:
+            return Position.from_fen(self.tags["FEN"])
+        return Position.initial()
+
+
+def read_games(lines: Iterable[str]) -> Iterator[PgnGame]:
+    """
+    Generator of games read from PGN lines, e.g. an open file.
+    Comments, variations, NAGs and move numbers are skipped, only main line SAN is kept.
+    """
+    game: PgnGame | None = None
+    in_comment = False
+    variation_depth = 0
+    for line_number, line in enumerate(lines, 1):
+        if not in_comment and variation_depth == 0:
+            if line.startswith("%"):
+                continue
+            tag = TAG_REGEX.match(line.lstrip())
+            if tag is not None:
+                # Game without result is ended by the tags of the next one
+                if game is not None and game.moves:
+                    yield game
+                    game = None
+                if game is None:
+                    game = PgnGame(line_number=line_number)
+                game.tags[tag.group(1)] = re.sub(r"\\(.)", r"\1", tag.group(2))
+                continue
+
+        for match in TOKEN_REGEX.finditer(line):
+            token = match.group()
+            if in_comment:
+                in_comment = token != "}"
+            elif token == "{":
+                in_comment = True
+            elif token == ";":
+                break
+            elif token == "(":
+                variation_depth += 1
+            elif token == ")":
+                variation_depth = max(variation_depth - 1, 0)
+            elif variation_depth or token[0] == "$" or token[-1] == ".":
+                continue
+            else:
+                if game is None:
+                    game = PgnGame(line_number=line_number)
+                if token in RESULTS:
+                    game.result = token
+                    yield game
+                    game = None
+                else:
+                    game.moves.append(token)
+    if game is not None and (game.moves or game.tags):
+        yield game
+
+
+def replay(game: PgnGame) -> Position:
+    """
+    Plays all moves of the game and returns the final position.
+    Played moves are kept in its undo stack.
+    Raises ValueError at the first illegal or unreadable move.
+    """
+    position = game.start_position()
+    for ply, san in enumerate(game.moves, 1):
+        try:
+            move = parse_san(position, san)
+        except ValueError as error:
+            raise ValueError(f"ply {ply}: {error}") from None
+        position.make_move(move)
+    return position
+
+
+def tag_pair(name: str, value: str) -> str:
+    """
+    Returns the tag pair line with quotes and backslashes of the value escaped
+    """
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'[{name} "{escaped}"]'
+
+
+def movetext(
+    moves: list[str],
+    result: str,
+    fullmove_number: int = 1,
+    white: bool = True,
+    comments: list[str] | None = None,
+) -> str:
+    """
+    Returns numbered SAN moves with their comments followed by the result,
+    wrapped to the PGN line length
+    """
+    comments = comments or []
+    tokens: list[str] = []
+    # Black move is numbered at the start and after a comment
+    number_black = True
+    for i, san in enumerate(moves):
+        if white:
+            tokens.append(f"{fullmove_number}.")
+        elif number_black:
+            tokens.append(f"{fullmove_number}...")
+        tokens.append(san)
+        if not white:
+            fullmove_number += 1
+        number_black = i < len(comments) and bool(comments[i])
+        if number_black:
+            # Closing brace would end the comment early
+            tokens.append("{" + comments[i].replace("}", ")") + "}")
+        white = not white
+    tokens.append(result)
+
+    lines: list[str] = []
+    line = ""
+    for token in tokens:
+        if not line:
+            line = token
+        elif len(line) + 1 + len(token) > LINE_LENGTH:
+            lines.append(line)
+            line = token
+        else:
+            line += f" {token}"
+    lines.append(line)
+    return "\n".join(lines)
+
+
+def start_move(fen: str) -> tuple[int, bool]:
+    """
+    Returns move number and whether White moves first, read from the FEN text alone,
+    so a game with an invalid FEN can still be written. Unreadable fields mean 1 and White.
+    """
+    fields = fen.split()
+    white = len(fields) < 2 or fields[1] != "b"
+    fullmove_number = 1
+    if len(fields) == 6 and fields[5].isdigit() and int(fields[5]) > 0:
+        fullmove_number = int(fields[5])
+    return fullmove_number, white
+
+
+def export(game: PgnGame) -> str:
+    """
+    Returns the game in PGN export format, ended by an empty line
+    """
+    tags = {name: "?" for name in SEVEN_TAG_ROSTER}
+    tags["Date"] = "????.??.??"
+    tags.update(game.tags)
+    tags["Result"] = game.result
+    if "FEN" in tags:
+        tags["SetUp"] = "1"
+    names = [*SEVEN_TAG_ROSTER, *(name for name in tags if name not in SEVEN_TAG_ROSTER)]
+    fullmove_number, white = start_move(game.tags.get("FEN", ""))
+    tag_lines = "\n".join(tag_pair(name, tags[name]) for name in names)
+    text = movetext(game.moves, game.result, fullmove_number, white, game.comments)
+    return f"{tag_lines}\n\n{text}\n\n"
+
+
+class PgnWriter:
+    """
+    Class writing games to a PGN file.
+    Every game is formatted into one string and written through a large buffer,
+    so streaming many games costs few system calls.
+    """
+
+    def __init__(self, path: str, append: bool = True, buffer_size: int = 1 << 16) -> None:
+        self.file = open(path, "a" if append else "w", encoding="utf-8", buffering=buffer_size)
+
+    def write(self, game: PgnGame) -> None:
+        self.file.write(export(game))
+
+    def write_games(self, games: Iterable[PgnGame]) -> None:
+        for game in games:
+            self.write(game)
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> "PgnWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
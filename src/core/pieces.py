@@ -0,0 +1,44 @@
+"""
+Piece and color codes used by the rules core.
+A piece is a small int: color << 3 | piece type, 0 means an empty square.
+Color values match game.Player values.
+"""
+
+BLACK = 0
+WHITE = 1
+COLORS = (WHITE, BLACK)
+
+EMPTY = 0
+PAWN = 1
+KNIGHT = 2
+BISHOP = 3
+ROOK = 4
+QUEEN = 5
+KING = 6
+PIECE_TYPES = (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING)
+PROMOTION_TYPES = (QUEEN, ROOK, BISHOP, KNIGHT)
+
+# Uppercase letters used in algebraic notation, pawns have no letter
+PIECE_IDS = {PAWN: "", KNIGHT: "N", BISHOP: "B", ROOK: "R", QUEEN: "Q", KING: "K"}
+PIECE_TYPE_BY_ID = {"N": KNIGHT, "B": BISHOP, "R": ROOK, "Q": QUEEN, "K": KING}
+
+
+def make_piece(color: int, piece_type: int) -> int:
+    """
+    Returns piece code from color and piece type
+    """
+    return color << 3 | piece_type
+
+
+def piece_type(piece: int) -> int:
+    """
+    Returns piece type of the piece code
+    """
+    return piece & 7
+
+
+def piece_color(piece: int) -> int:
+    """
+    Returns color of the piece code
+    """
+    return piece >> 3
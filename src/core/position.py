@@ -0,0 +1,290 @@
+from core import fen
+from core import move as mv
+from core import movegen, zobrist
+from core.bitboard import BB_SQUARES, msb
+from core.castling import ALL_CASTLING, CASTLING_MASK, CASTLING_MOVES
+from core.pieces import (
+    BISHOP,
+    BLACK,
+    EMPTY,
+    KING,
+    KNIGHT,
+    PAWN,
+    QUEEN,
+    ROOK,
+    WHITE,
+    make_piece,
+    piece_color,
+    piece_type,
+)
+from core.squares import col_of, row_of, square
+from core.tables import (
+    KING_ATTACKS,
+    KNIGHT_ATTACKS,
+    PAWN_ATTACKS,
+    bishop_attacks,
+    rook_attacks,
+)
+
+START_ROW = (ROOK, KNIGHT, BISHOP, QUEEN, KING, BISHOP, KNIGHT, ROOK)
+
+
+class Position:
+    """
+    Class representing the chess position.
+    It holds the whole game state and the rules, without any rendering.
+
+    Pieces are kept twice: in the board list indexed by square
+    and in bitboards indexed by piece code, plus occupancy per color.
+    Every made move leaves a small undo record, so it can be unmade without copies.
+    Zobrist key of the position is updated with every change.
+    """
+
+    def __init__(self) -> None:
+        self.board: list[int] = [EMPTY] * 64
+        self.bitboards: list[int] = [0] * 16
+        self.occupied_co: list[int] = [0, 0]
+        self.occupied = 0
+        self.turn = WHITE
+        self.castling = 0
+        self.ep_square: int | None = None
+        self.halfmove_clock = 0
+        self.fullmove_number = 1
+        self.key = 0
+        # (move, captured piece, castling, en passant square, halfmove clock, key)
+        self.undo_stack: list[tuple[int, int, int, int | None, int, int]] = []
+
+    @classmethod
+    def initial(cls) -> "Position":
+        """
+        Returns the starting position
+        """
+        position = cls()
+        for col_i, ptype in enumerate(START_ROW):
+            position.put_piece(square(0, col_i), make_piece(WHITE, ptype))
+            position.put_piece(square(1, col_i), make_piece(WHITE, PAWN))
+            position.put_piece(square(6, col_i), make_piece(BLACK, PAWN))
+            position.put_piece(square(7, col_i), make_piece(BLACK, ptype))
+        position.castling = ALL_CASTLING
+        position.key = zobrist.compute_key(position)
+        return position
+
+    @classmethod
+    def from_fen(cls, text: str) -> "Position":
+        """
+        Returns the position described by the FEN
+        """
+        position = cls()
+        fen.set_fen(position, text)
+        return position
+
+    def fen(self) -> str:
+        """
+        Returns the FEN of the position
+        """
+        return fen.fen(self)
+
+    def copy(self) -> "Position":
+        position = Position()
+        position.board = self.board.copy()
+        position.bitboards = self.bitboards.copy()
+        position.occupied_co = self.occupied_co.copy()
+        position.occupied = self.occupied
+        position.turn = self.turn
+        position.castling = self.castling
+        position.ep_square = self.ep_square
+        position.halfmove_clock = self.halfmove_clock
+        position.fullmove_number = self.fullmove_number
+        position.key = self.key
+        position.undo_stack = self.undo_stack.copy()
+        return position
+
+    def piece_at(self, sq: int) -> int:
+        return self.board[sq]
+
+    def put_piece(self, sq: int, piece: int) -> None:
+        """
+        Puts the piece on an empty square
+        """
+        bb = BB_SQUARES[sq]
+        self.board[sq] = piece
+        self.bitboards[piece] |= bb
+        self.occupied_co[piece_color(piece)] |= bb
+        self.occupied |= bb
+        self.key ^= zobrist.PIECE_KEYS[piece][sq]
+
+    def remove_piece(self, sq: int) -> int:
+        """
+        Removes the piece from the square and returns it
+        """
+        piece = self.board[sq]
+        if piece == EMPTY:
+            return piece
+        bb = BB_SQUARES[sq]
+        self.board[sq] = EMPTY
+        self.bitboards[piece] ^= bb
+        self.occupied_co[piece_color(piece)] ^= bb
+        self.occupied ^= bb
+        self.key ^= zobrist.PIECE_KEYS[piece][sq]
+        return piece
+
+    def pieces(self, color: int, ptype: int) -> int:
+        """
+        Returns bitboard of the pieces of the color and type
+        """
+        return self.bitboards[make_piece(color, ptype)]
+
+    def king_square(self, color: int) -> int:
+        king = self.bitboards[make_piece(color, KING)]
+        if not king:
+            raise Exception("Impossible! King not found on the board")
+        return msb(king)
+
+    def is_attacked(self, sq: int, by_color: int) -> bool:
+        """
+        Returns True if the square is attacked by any piece of the color
+        """
+        bitboards = self.bitboards
+        # Pawns attack the square from where a Pawn of the other color would capture
+        if PAWN_ATTACKS[by_color ^ 1][sq] & bitboards[make_piece(by_color, PAWN)]:
+            return True
+        if KNIGHT_ATTACKS[sq] & bitboards[make_piece(by_color, KNIGHT)]:
+            return True
+        if KING_ATTACKS[sq] & bitboards[make_piece(by_color, KING)]:
+            return True
+        queens = bitboards[make_piece(by_color, QUEEN)]
+        if rook_attacks(sq, self.occupied) & (bitboards[make_piece(by_color, ROOK)] | queens):
+            return True
+        if bishop_attacks(sq, self.occupied) & (bitboards[make_piece(by_color, BISHOP)] | queens):
+            return True
+        return False
+
+    def is_check(self) -> bool:
+        """
+        Returns True if the side to move is in check
+        """
+        return self.is_attacked(self.king_square(self.turn), self.turn ^ 1)
+
+    def legal_moves(self) -> list[int]:
+        """
+        Returns moves which don't leave own King in check
+        """
+        return movegen.legal_moves(self)
+
+    def is_capture(self, move: int) -> bool:
+        return self.board[mv.to_square(move)] != EMPTY or mv.flag(move) == mv.EN_PASSANT
+
+    def make_move(self, move: int) -> None:
+        """
+        Plays the move. Move must be pseudo legal.
+        """
+        from_sq = mv.from_square(move)
+        to_sq = mv.to_square(move)
+        flag = mv.flag(move)
+
+        key = self.key
+        # En passant key depends on the pawns, so it is taken out before any of them moves
+        self.key ^= zobrist.ep_key(self)
+        piece = self.remove_piece(from_sq)
+        if flag == mv.EN_PASSANT:
+            captured = self.remove_piece(square(row_of(from_sq), col_of(to_sq)))
+        else:
+            captured = self.remove_piece(to_sq)
+        self.undo_stack.append(
+            (move, captured, self.castling, self.ep_square, self.halfmove_clock, key)
+        )
+        if mv.promotion(move):
+            self.put_piece(to_sq, make_piece(self.turn, mv.promotion(move)))
+        else:
+            self.put_piece(to_sq, piece)
+        if flag == mv.CASTLING:
+            for _, king_from, king_to, rook_from, rook_to, _ in CASTLING_MOVES[self.turn]:
+                if (king_from, king_to) == (from_sq, to_sq):
+                    self.put_piece(rook_to, self.remove_piece(rook_from))
+
+        self.key ^= zobrist.CASTLING_KEYS[self.castling]
+        self.ep_square = (from_sq + to_sq) // 2 if flag == mv.DOUBLE_PUSH else None
+        self.castling &= CASTLING_MASK[from_sq] & CASTLING_MASK[to_sq]
+        self.key ^= zobrist.CASTLING_KEYS[self.castling] ^ zobrist.TURN_KEY
+        if piece_type(piece) == PAWN or captured != EMPTY:
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+        if self.turn == BLACK:
+            self.fullmove_number += 1
+        self.turn ^= 1
+        self.key ^= zobrist.ep_key(self)
+
+    def unmake_move(self) -> int:
+        """
+        Takes back the last made move and returns it
+        """
+        move, captured, castling, ep_square, halfmove_clock, key = self.undo_stack.pop()
+        from_sq = mv.from_square(move)
+        to_sq = mv.to_square(move)
+        flag = mv.flag(move)
+        self.turn ^= 1
+        if self.turn == BLACK:
+            self.fullmove_number -= 1
+
+        piece = self.remove_piece(to_sq)
+        if mv.promotion(move):
+            piece = make_piece(self.turn, PAWN)
+        self.put_piece(from_sq, piece)
+        if flag == mv.CASTLING:
+            for _, king_from, king_to, rook_from, rook_to, _ in CASTLING_MOVES[self.turn]:
+                if (king_from, king_to) == (from_sq, to_sq):
+                    self.put_piece(rook_from, self.remove_piece(rook_to))
+        if captured != EMPTY:
+            if flag == mv.EN_PASSANT:
+                self.put_piece(square(row_of(from_sq), col_of(to_sq)), captured)
+            else:
+                self.put_piece(to_sq, captured)
+
+        self.castling = castling
+        self.ep_square = ep_square
+        self.halfmove_clock = halfmove_clock
+        self.key = key
+        return move
+
+    def parse_uci(self, text: str) -> int:
+        """
+        Returns legal move matching the UCI notation
+        """
+        from_sq, to_sq, promotion_type = mv.parse_uci(text)
+        for move in self.legal_moves():
+            if (
+                mv.from_square(move) == from_sq
+                and mv.to_square(move) == to_sq
+                and mv.promotion(move) == promotion_type
+            ):
+                return move
+        raise ValueError(f"Illegal move: {text!r}")
+
+    def is_repetition(self, count: int = 3) -> bool:
+        """
+        Returns True if the position occurred count times since the last irreversible move
+        """
+        occurrences = 1
+        # Undo records keep keys of earlier positions, only the last halfmove_clock
+        # of them can repeat and only every second one has the same side to move
+        ply = len(self.undo_stack)
+        oldest_ply = max(ply - self.halfmove_clock, 0)
+        for i in range(ply - 2, oldest_ply - 1, -2):
+            if self.undo_stack[i][5] == self.key:
+                occurrences += 1
+                if occurrences >= count:
+                    return True
+        return False
+
+    def is_fifty_moves(self) -> bool:
+        """
+        Returns True if no capture or Pawn move was made in the last fifty moves
+        """
+        return self.halfmove_clock >= 100
+
+    def is_checkmate(self) -> bool:
+        return self.is_check() and not self.legal_moves()
+
+    def is_stalemate(self) -> bool:
+        return not self.is_check() and not self.legal_moves()
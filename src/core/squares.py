@@ -0,0 +1,50 @@
+"""
+Square indexing used by the rules core.
+Squares are numbered row by row from a1 = 0 to h8 = 63,
+so Coord(row_i, col_i) maps to row_i * 8 + col_i.
+"""
+
+FILE_NAMES = "abcdefgh"
+RANK_NAMES = "12345678"
+
+
+def square(row_i: int, col_i: int) -> int:
+    """
+    Returns square index from row and column indexes
+    """
+    return row_i * 8 + col_i
+
+
+def row_of(sq: int) -> int:
+    """
+    Returns row index of the square
+    """
+    return sq >> 3
+
+
+def col_of(sq: int) -> int:
+    """
+    Returns column index of the square
+    """
+    return sq & 7
+
+
+def square_name(sq: int) -> str:
+    """
+    Returns square name\n
+    e.g 12 -> 'e2'
+    """
+    return f"{FILE_NAMES[sq & 7]}{RANK_NAMES[sq >> 3]}"
+
+
+def parse_square(name: str) -> int:
+    """
+    Returns square index from its name\n
+    e.g 'e2' -> 12
+    """
+    if len(name) != 2 or name[0] not in FILE_NAMES or name[1] not in RANK_NAMES:
+        raise ValueError(f"Invalid square name: {name!r}")
+    return square(RANK_NAMES.index(name[1]), FILE_NAMES.index(name[0]))
+
+
+SQUARE_NAMES = [square_name(sq) for sq in range(64)]
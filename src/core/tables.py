@@ -0,0 +1,121 @@
+"""
+Attack tables computed once at import.
+Leaper attacks are indexed by square, rays by direction and square,
+slider attacks by square and the relevant occupancy.
+"""
+
+from core.bitboard import (
+    BB_SQUARES,
+    king_attacks,
+    knight_attacks,
+    lsb,
+    msb,
+    pawn_attacks,
+)
+from core.pieces import BLACK, WHITE
+from core.squares import col_of, row_of, square
+
+# Directions as (row step, column step), indexed by the direction constants
+NORTH, NORTH_EAST, EAST, SOUTH_EAST, SOUTH, SOUTH_WEST, WEST, NORTH_WEST = range(8)
+DIRECTIONS = ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+ROOK_DIRECTIONS = (NORTH, EAST, SOUTH, WEST)
+BISHOP_DIRECTIONS = (NORTH_EAST, SOUTH_EAST, SOUTH_WEST, NORTH_WEST)
+# Directions going towards higher square indexes, their nearest blocker is the lowest bit
+POSITIVE_DIRECTIONS = (NORTH, NORTH_EAST, EAST, NORTH_WEST)
+
+
+def ray_squares(sq: int, direction: int) -> list[int]:
+    """
+    Returns squares from the square (excluded) to the board edge in the direction
+    """
+    row_step, col_step = DIRECTIONS[direction]
+    squares: list[int] = []
+    row_i, col_i = row_of(sq) + row_step, col_of(sq) + col_step
+    while 0 <= row_i < 8 and 0 <= col_i < 8:
+        squares.append(square(row_i, col_i))
+        row_i, col_i = row_i + row_step, col_i + col_step
+    return squares
+
+
+KNIGHT_ATTACKS = [knight_attacks(bb) for bb in BB_SQUARES]
+KING_ATTACKS = [king_attacks(bb) for bb in BB_SQUARES]
+PAWN_ATTACKS = {
+    WHITE: [pawn_attacks(bb, True) for bb in BB_SQUARES],
+    BLACK: [pawn_attacks(bb, False) for bb in BB_SQUARES],
+}
+RAY_SQUARES = [[ray_squares(sq, direction) for sq in range(64)] for direction in range(8)]
+RAYS = [
+    [sum(BB_SQUARES[target] for target in RAY_SQUARES[direction][sq]) for sq in range(64)]
+    for direction in range(8)
+]
+
+
+def ray_attacks(sq: int, occupied: int, direction: int) -> int:
+    """
+    Returns ray from the square up to and including the first occupied square
+    """
+    ray = RAYS[direction][sq]
+    blockers = ray & occupied
+    if blockers:
+        blocker = lsb(blockers) if direction in POSITIVE_DIRECTIONS else msb(blockers)
+        ray ^= RAYS[direction][blocker]
+    return ray
+
+
+def slider_table(directions: tuple[int, ...]) -> tuple[list[int], list[dict[int, int]]]:
+    """
+    Returns relevant occupancy masks and attack tables of a slider for every square.
+    Mask drops the board edge because a piece there never blocks anything further.
+    The table maps every subset of the mask to the attacks, so the lookup is
+    a dict fetch by the masked occupancy (what PEXT/magic indexing compress to a slot).
+    """
+    masks: list[int] = []
+    tables: list[dict[int, int]] = []
+    for sq in range(64):
+        mask = 0
+        for direction in directions:
+            for target in RAY_SQUARES[direction][sq][:-1]:
+                mask |= BB_SQUARES[target]
+        table: dict[int, int] = {}
+        # Carry-Rippler enumeration of all mask subsets
+        subset = 0
+        while True:
+            attacks = 0
+            for direction in directions:
+                attacks |= ray_attacks(sq, subset, direction)
+            table[subset] = attacks
+            subset = (subset - mask) & mask
+            if not subset:
+                break
+        masks.append(mask)
+        tables.append(table)
+    return masks, tables
+
+
+ROOK_MASKS, ROOK_TABLE = slider_table(ROOK_DIRECTIONS)
+BISHOP_MASKS, BISHOP_TABLE = slider_table(BISHOP_DIRECTIONS)
+
+
+def rook_attacks(sq: int, occupied: int) -> int:
+    return ROOK_TABLE[sq][occupied & ROOK_MASKS[sq]]
+
+
+def bishop_attacks(sq: int, occupied: int) -> int:
+    return BISHOP_TABLE[sq][occupied & BISHOP_MASKS[sq]]
+
+
+def queen_attacks(sq: int, occupied: int) -> int:
+    return ROOK_TABLE[sq][occupied & ROOK_MASKS[sq]] | BISHOP_TABLE[sq][occupied & BISHOP_MASKS[sq]]
+
+
+def between_squares(from_sq: int, to_sq: int) -> int:
+    """
+    Returns squares strictly between two squares on a common line, otherwise empty bitboard
+    """
+    for direction in range(8):
+        if to_sq in RAY_SQUARES[direction][from_sq]:
+            return RAYS[direction][from_sq] & ~RAYS[direction][to_sq] & ~BB_SQUARES[to_sq]
+    return 0
+
+
+BETWEEN = [[between_squares(from_sq, to_sq) for to_sq in range(64)] for from_sq in range(64)]
@@ -0,0 +1,56 @@
+"""
+Zobrist keys of positions.
+Keys come from a fixed seed, so they are the same in every process and run.
+"""
+
+import random
+from typing import TYPE_CHECKING
+
+from core.bitboard import iter_squares
+from core.pieces import PAWN, WHITE, make_piece
+from core.squares import col_of
+from core.tables import PAWN_ATTACKS
+
+if TYPE_CHECKING:
+    from core.position import Position
+
+_generator = random.Random(0x5A0B2157)
+
+# Indexed by piece code and square, empty piece code 0 has no keys
+PIECE_KEYS = [[_generator.getrandbits(64) for _ in range(64)] for _ in range(16)]
+# Indexed by castling rights flags, no rights means no key
+CASTLING_KEYS = [0] + [_generator.getrandbits(64) for _ in range(15)]
+# Indexed by en passant file
+EP_KEYS = [_generator.getrandbits(64) for _ in range(8)]
+# Xored in when black is to move
+TURN_KEY = _generator.getrandbits(64)
+
+
+def ep_key(position: "Position") -> int:
+    """
+    Returns key of the en passant file, which counts only if a pawn of the side to move
+    attacks the en passant square, so positions differing by an unusable one are the same
+    """
+    ep_square = position.ep_square
+    if ep_square is None:
+        return 0
+    # Pawns attack the square from where a Pawn of the other color would capture
+    pawns = position.bitboards[make_piece(position.turn, PAWN)]
+    if not PAWN_ATTACKS[position.turn ^ 1][ep_square] & pawns:
+        return 0
+    return EP_KEYS[col_of(ep_square)]
+
+
+def compute_key(position: "Position") -> int:
+    """
+    Returns key of the position computed from scratch
+    """
+    key = 0
+    for piece, bb in enumerate(position.bitboards):
+        for sq in iter_squares(bb):
+            key ^= PIECE_KEYS[piece][sq]
+    key ^= CASTLING_KEYS[position.castling]
+    key ^= ep_key(position)
+    if position.turn != WHITE:
+        key ^= TURN_KEY
+    return key
@@ -0,0 +1,163 @@
+"""
+Polyglot opening books.
+A book is a file of 16-byte entries sorted by position key, it is memory-mapped
+and searched in place, so processes using the same book share one page cache copy.
+"""
+
+import mmap
+import random
+import struct
+from collections.abc import Iterable
+from types import TracebackType
+
+from core import move as mv
+from core.castling import CASTLING_MOVES
+from core.notation import parse_san
+from core.pgn import PgnGame
+from core.pieces import WHITE
+from core.position import Position
+from core.squares import col_of, row_of
+from engine.polyglot import polyglot_key
+
+# Big-endian key, move, weight and learn value
+ENTRY = struct.Struct(">QHHI")
+KEY = struct.Struct(">Q")
+MAX_WEIGHT = 0xFFFF
+# Moves of the book builder are taken up to this ply of every game
+DEFAULT_BOOK_PLIES = 24
+
+# King moves of castling, Polyglot writes them as the king capturing its own rook
+CASTLING_ROOKS = {
+    (king_from, king_to): rook_from
+    for castlings in CASTLING_MOVES.values()
+    for _, king_from, king_to, rook_from, _, _ in castlings
+}
+
+
+def encode_move(move: int) -> int:
+    """
+    Returns the move in Polyglot format
+    """
+    from_sq = mv.from_square(move)
+    to_sq = mv.to_square(move)
+    if mv.flag(move) == mv.CASTLING:
+        to_sq = CASTLING_ROOKS[(from_sq, to_sq)]
+    # Promotion piece types are one above Polyglot ones, which start with the Knight
+    promotion = mv.promotion(move) - 1 if mv.promotion(move) else 0
+    return (
+        col_of(to_sq)
+        | row_of(to_sq) << 3
+        | col_of(from_sq) << 6
+        | row_of(from_sq) << 9
+        | (promotion << 12)
+    )
+
+
+class OpeningBook:
+    """
+    Class looking up moves of positions in a Polyglot book file.
+    Entries are found by binary search on the memory-mapped file, none are read in advance.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Raises ValueError for an empty file, which can't be mapped
+        """
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.size = len(self.data) // ENTRY.size
+
+    def entries(self, key: int) -> list[tuple[int, int]]:
+        """
+        Returns Polyglot move and weight of every entry of the key
+        """
+        low, high = 0, self.size
+        # First entry with the key or a greater one
+        while low < high:
+            middle = (low + high) // 2
+            if KEY.unpack_from(self.data, middle * ENTRY.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        entries: list[tuple[int, int]] = []
+        for i in range(low, self.size):
+            entry_key, book_move, weight, _ = ENTRY.unpack_from(self.data, i * ENTRY.size)
+            if entry_key != key:
+                break
+            entries.append((book_move, weight))
+        return entries
+
+    def moves(self, position: Position) -> list[tuple[int, int]]:
+        """
+        Returns legal book moves of the position with their weights
+        """
+        entries = self.entries(polyglot_key(position))
+        if not entries:
+            return []
+        legal_moves = {encode_move(move): move for move in position.legal_moves()}
+        return [
+            (legal_moves[book_move], weight)
+            for book_move, weight in entries
+            if book_move in legal_moves
+        ]
+
+    def choose(self, position: Position, rng: random.Random | None = None) -> int | None:
+        """
+        Returns a book move picked at random by weight, None when the position is out of book
+        """
+        moves = [(move, weight) for move, weight in self.moves(position) if weight]
+        if not moves:
+            return None
+        rng = rng or random.Random()
+        return rng.choices([move for move, _ in moves], [weight for _, weight in moves])[0]
+
+    def close(self) -> None:
+        self.data.close()
+
+    def __enter__(self) -> "OpeningBook":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def build_book(games: Iterable[PgnGame], path: str, max_plies: int = DEFAULT_BOOK_PLIES) -> int:
+    """
+    Writes a Polyglot book of the moves played in the games and returns number of its entries.
+    A move scores 2 for a win and 1 for a draw of the player making it, weights are
+    the scores scaled to the 16-bit range. Games with an illegal move are used up to it.
+    """
+    scores: dict[tuple[int, int], int] = {}
+    for game in games:
+        position = game.start_position()
+        for text in game.moves[:max_plies]:
+            try:
+                move = parse_san(position, text)
+            except ValueError:
+                break
+            if game.result == "1/2-1/2":
+                score = 1
+            elif game.result == ("1-0" if position.turn == WHITE else "0-1"):
+                score = 2
+            else:
+                score = 0
+            entry = (polyglot_key(position), encode_move(move))
+            scores[entry] = scores.get(entry, 0) + score
+            position.make_move(move)
+
+    top_score = max(scores.values(), default=0)
+    scale = MAX_WEIGHT / top_score if top_score > MAX_WEIGHT else 1
+    with open(path, "wb") as file:
+        # Sorted by key, best moves of a position first
+        for (key, book_move), score in sorted(
+            scores.items(), key=lambda item: (item[0][0], -item[1])
+        ):
+            # Scaling never drops a scoring move to zero weight
+            weight = max(int(score * scale), 1) if score else 0
+            file.write(ENTRY.pack(key, book_move, weight, 0))
+    return len(scores)
@@ -0,0 +1,177 @@
+"""
+Static evaluation of rules core positions: material plus piece-square tables.
+Scores are in centipawns from the side to move point of view.
+"""
+
+from typing import TYPE_CHECKING
+
+from core.bitboard import iter_squares
+from core.pieces import (
+    BISHOP,
+    BLACK,
+    KING,
+    KNIGHT,
+    PAWN,
+    PIECE_TYPES,
+    QUEEN,
+    ROOK,
+    WHITE,
+    make_piece,
+)
+
+if TYPE_CHECKING:
+    from core.position import Position
+
+INFINITY = 1_000_000
+MATE_SCORE = 100_000
+# Scores beyond this bound are mates, their distance is MATE_SCORE - abs(score)
+MATE_BOUND = MATE_SCORE - 1_000
+
+PIECE_VALUES = {PAWN: 100, KNIGHT: 320, BISHOP: 330, ROOK: 500, QUEEN: 900, KING: 0}
+
+# Tables are written as seen from White, rank 8 first
+# fmt: off
+PAWN_TABLE = (
+    0,   0,   0,   0,   0,   0,   0,   0,
+    50,  50,  50,  50,  50,  50,  50,  50,
+    10,  10,  20,  30,  30,  20,  10,  10,
+    5,   5,  10,  25,  25,  10,   5,   5,
+    0,   0,   0,  20,  20,   0,   0,   0,
+    5,  -5, -10,   0,   0, -10,  -5,   5,
+    5,  10,  10, -20, -20,  10,  10,   5,
+    0,   0,   0,   0,   0,   0,   0,   0,
+)
+KNIGHT_TABLE = (
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20,   0,   0,   0,   0, -20, -40,
+    -30,   0,  10,  15,  15,  10,   0, -30,
+    -30,   5,  15,  20,  20,  15,   5, -30,
+    -30,   0,  15,  20,  20,  15,   0, -30,
+    -30,   5,  10,  15,  15,  10,   5, -30,
+    -40, -20,   0,   5,   5,   0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+)
+BISHOP_TABLE = (
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,  10,  10,   5,   0, -10,
+    -10,   5,   5,  10,  10,   5,   5, -10,
+    -10,   0,  10,  10,  10,  10,   0, -10,
+    -10,  10,  10,  10,  10,  10,  10, -10,
+    -10,   5,   0,   0,   0,   0,   5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+)
+ROOK_TABLE = (
+    0,   0,   0,   0,   0,   0,   0,   0,
+    5,  10,  10,  10,  10,  10,  10,   5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    -5,   0,   0,   0,   0,   0,   0,  -5,
+    0,   0,   0,   5,   5,   0,   0,   0,
+)
+QUEEN_TABLE = (
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,   5,   5,   5,   0, -10,
+    -5,   0,   5,   5,   5,   5,   0,  -5,
+    0,   0,   5,   5,   5,   5,   0,  -5,
+    -10,   5,   5,   5,   5,   5,   0, -10,
+    -10,   0,   5,   0,   0,   0,   0, -10,
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+)
+KING_MIDDLEGAME_TABLE = (
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+    20,  20,   0,   0,   0,   0,  20,  20,
+    20,  30,  10,   0,   0,  10,  30,  20,
+)
+KING_ENDGAME_TABLE = (
+    -50, -40, -30, -20, -20, -30, -40, -50,
+    -30, -20, -10,   0,   0, -10, -20, -30,
+    -30, -10,  20,  30,  30,  20, -10, -30,
+    -30, -10,  30,  40,  40,  30, -10, -30,
+    -30, -10,  30,  40,  40,  30, -10, -30,
+    -30, -10,  20,  30,  30,  20, -10, -30,
+    -30, -30,   0,   0,   0,   0, -30, -30,
+    -50, -30, -30, -30, -30, -30, -30, -50,
+)
+# fmt: on
+
+PIECE_TABLES = {
+    PAWN: PAWN_TABLE,
+    KNIGHT: KNIGHT_TABLE,
+    BISHOP: BISHOP_TABLE,
+    ROOK: ROOK_TABLE,
+    QUEEN: QUEEN_TABLE,
+    KING: KING_MIDDLEGAME_TABLE,
+}
+
+# Game phase weights of pieces, 24 is the full set of minor and major pieces
+PHASE_WEIGHTS = {KNIGHT: 1, BISHOP: 1, ROOK: 2, QUEEN: 4}
+MAX_PHASE = 24
+
+
+def square_table(table: tuple[int, ...], color: int) -> list[int]:
+    """
+    Returns the table indexed by core square for pieces of the color.
+    Tables are written rank 8 first, so White squares are mirrored vertically.
+    """
+    return [table[sq ^ 56] if color == WHITE else table[sq] for sq in range(64)]
+
+
+# Material plus position bonus, signed for White, indexed by piece code and square
+PIECE_SQUARE_VALUES = [[0] * 64 for _ in range(16)]
+# King endgame minus middlegame bonus, scaled by game phase during evaluation
+KING_ENDGAME_DELTA = [[0] * 64 for _ in range(16)]
+for _color, _sign in ((WHITE, 1), (BLACK, -1)):
+    for _ptype in PIECE_TYPES:
+        PIECE_SQUARE_VALUES[make_piece(_color, _ptype)] = [
+            _sign * (PIECE_VALUES[_ptype] + bonus)
+            for bonus in square_table(PIECE_TABLES[_ptype], _color)
+        ]
+    KING_ENDGAME_DELTA[make_piece(_color, KING)] = [
+        _sign * (endgame - middlegame)
+        for middlegame, endgame in zip(
+            square_table(KING_MIDDLEGAME_TABLE, _color), square_table(KING_ENDGAME_TABLE, _color)
+        )
+    ]
+
+
+def game_phase(position: "Position") -> int:
+    """
+    Returns game phase from MAX_PHASE in the opening down to 0 in pawn endings
+    """
+    phase = 0
+    for ptype, weight in PHASE_WEIGHTS.items():
+        for color in (WHITE, BLACK):
+            phase += weight * position.bitboards[make_piece(color, ptype)].bit_count()
+    return min(phase, MAX_PHASE)
+
+
+def evaluate(position: "Position") -> int:
+    """
+    Returns static evaluation of the position for the side to move
+    """
+    score = 0
+    bitboards = position.bitboards
+    for piece, bb in enumerate(bitboards):
+        values = PIECE_SQUARE_VALUES[piece]
+        for sq in iter_squares(bb):
+            score += values[sq]
+
+    # Kings move from shelter to the centre as pieces come off
+    endgame_weight = MAX_PHASE - game_phase(position)
+    if endgame_weight:
+        king_delta = 0
+        for color in (WHITE, BLACK):
+            king = make_piece(color, KING)
+            for sq in iter_squares(bitboards[king]):
+                king_delta += KING_ENDGAME_DELTA[king][sq]
+        score += king_delta * endgame_weight // MAX_PHASE
+    return score if position.turn == WHITE else -score
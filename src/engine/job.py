@@ -0,0 +1,181 @@
+"""
+Engine searches running in separate processes.
+The search doesn't hold the interpreter lock of the caller, so a window keeps its frame rate.
+Several worker processes make a Lazy SMP search: all of them search the same root
+and share results through one transposition table in shared memory.
+"""
+
+import multiprocessing as mp
+import signal
+import threading
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Event
+
+from core.position import Position
+from engine.search import MAX_DEPTH, Searcher, SearchLimits, SearchResult
+from engine.tt import DEFAULT_MEMORY_MB, TranspositionTable
+
+SEARCH = "search"
+CLEAR = "clear"
+# Sent by the main worker before the final result
+ITERATION = "iteration"
+
+
+def serve(connection: Connection, stop_event: Event, memory: SharedMemory, worker: int) -> None:
+    """
+    Runs searches requested through the connection until None is received.
+    The main worker reports every completed iteration, helpers only the final result.
+    """
+    # Forked from a window, which handles SIGTERM as a quit event, terminate must still work
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    searcher = Searcher(TranspositionTable(buffer=memory.buf), worker)
+
+    def send_iteration(result: SearchResult) -> None:
+        connection.send((ITERATION, result))
+
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+        if request[0] == CLEAR:
+            # Shared table memory is cleared once, other workers only restart the generations
+            if worker == 0:
+                searcher.tt.clear()
+            else:
+                searcher.tt.generation = 0
+        elif request[0] == SEARCH:
+            _, position, limits = request
+            if worker == 0:
+                result = searcher.search(position, limits, send_iteration, stop_event)
+            else:
+                # Helpers search until the main worker is done
+                result = searcher.search(position, SearchLimits(depth=MAX_DEPTH), None, stop_event)
+            connection.send((SEARCH, result))
+
+
+class EngineProcess:
+    """
+    Class owning the engine worker processes, which run one search at a time.
+    With more than one worker the helpers search the root at staggered depths,
+    filling the shared transposition table with results the main worker picks up.
+    """
+
+    def __init__(self, memory_mb: int = DEFAULT_MEMORY_MB, workers: int = 1) -> None:
+        self.memory = SharedMemory(create=True, size=TranspositionTable.size_in_bytes(memory_mb))
+        self.stop_event = mp.Event()
+        self.connections: list[Connection] = []
+        self.processes: list[mp.Process] = []
+        for worker in range(max(workers, 1)):
+            connection, worker_connection = mp.Pipe()
+            # Daemon process doesn't keep the app alive when the window is closed mid search
+            process = mp.Process(
+                target=serve,
+                args=(worker_connection, self.stop_event, self.memory, worker),
+                daemon=True,
+            )
+            process.start()
+            self.connections.append(connection)
+            self.processes.append(process)
+
+    def search(
+        self,
+        position: Position,
+        limits: SearchLimits,
+        on_iteration: Callable[[SearchResult], None] | None = None,
+    ) -> SearchResult:
+        """
+        Returns the best move found within the limits, blocking until the search is done.
+        Callback is called with the result of every iteration completed by the main worker.
+        Result of the deepest iteration completed by any worker is returned,
+        with nodes of all workers.
+        """
+        for connection in self.connections:
+            connection.send((SEARCH, position, limits))
+        main = self.connections[0]
+        while True:
+            kind, result = main.recv()
+            if kind == SEARCH:
+                break
+            if on_iteration is not None:
+                on_iteration(result)
+
+        self.stop_event.set()
+        nodes = result.nodes
+        for connection in self.connections[1:]:
+            _, helper_result = connection.recv()
+            nodes += helper_result.nodes
+            if helper_result.depth > result.depth:
+                result = helper_result
+        # Stop requested before the search started is only cleared here, so it is never lost
+        self.stop_event.clear()
+        return SearchResult(result.move, result.score, result.depth, nodes, result.time)
+
+    def stop(self) -> None:
+        """
+        Makes the running search return its best move so far within a few milliseconds
+        """
+        self.stop_event.set()
+
+    def clear(self) -> None:
+        """
+        Clears the transposition table before a new game
+        """
+        for connection in self.connections:
+            connection.send((CLEAR,))
+
+    def close(self) -> None:
+        self.stop_event.set()
+        for connection in self.connections:
+            connection.send(None)
+        for process in self.processes:
+            process.join()
+        self.memory.close()
+        self.memory.unlink()
+
+
+class SearchJob:
+    """
+    Class running one search in the engine processes.
+    A helper thread waits for the result, so the caller never blocks,
+    and calls back with it and with completed iterations from that thread.
+    Cancelling makes the search return its best move so far within a few milliseconds.
+    """
+
+    def __init__(
+        self,
+        engine: EngineProcess,
+        position: Position,
+        limits: SearchLimits,
+        on_done: Callable[["SearchJob", SearchResult], None],
+        on_iteration: Callable[[SearchResult], None] | None = None,
+    ) -> None:
+        self.engine = engine
+        self.position = position
+        self.limits = limits
+        self.on_done = on_done
+        self.on_iteration = on_iteration
+        self.result: SearchResult | None = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def run(self) -> None:
+        self.result = self.engine.search(self.position, self.limits, self.on_iteration)
+        self.on_done(self, self.result)
+
+    def cancel(self) -> None:
+        """
+        Stops the search and waits for its result
+        """
+        self.engine.stop()
+        if self.thread.is_alive():
+            self.thread.join()
+        # Search is over, stop must not reach the next one
+        self.engine.stop_event.clear()
+
+    @property
+    def done(self) -> bool:
+        return self.result is not None
@@ -0,0 +1,97 @@
+"""
+Move ordering of the search.
+Every move gets a sort key with its order score above the 17 move bits,
+so a move list is ordered by one sort of plain ints.
+"""
+
+from core import move as mv
+from core.pieces import KING, PAWN, QUEEN, piece_type
+from core.position import Position
+
+MOVE_MASK = (1 << 17) - 1
+SCORE_SHIFT = 17
+
+# Order stages, from the first searched
+HASH_MOVE_SCORE = 1 << 30
+CAPTURE_SCORE = 1 << 28
+KILLER_SCORES = ((1 << 27) + 1, 1 << 27)
+# History scores are halved when they reach the limit, so quiet moves stay below killers
+HISTORY_LIMIT = 1 << 26
+
+KILLER_SLOTS = 2
+# Deeper than any search line
+MAX_PLY = 128
+
+
+class MoveOrdering:
+    """
+    Class ordering moves: hash move, captures by MVV-LVA, killer moves
+    and quiet moves by the history heuristic.
+    Killers are quiet moves which caused a cutoff at the same ply in a sibling node,
+    history counts cutoffs of a piece moving to a square anywhere in the tree.
+    """
+
+    def __init__(self) -> None:
+        self.killers = [[mv.NULL_MOVE] * KILLER_SLOTS for _ in range(MAX_PLY)]
+        # Indexed by piece code and destination square
+        self.history = [[0] * 64 for _ in range(16)]
+
+    def new_search(self) -> None:
+        """
+        Forgets killers and ages history, positions of the next search are different
+        """
+        self.killers = [[mv.NULL_MOVE] * KILLER_SLOTS for _ in range(MAX_PLY)]
+        for scores in self.history:
+            for sq in range(64):
+                scores[sq] >>= 1
+
+    def capture_score(self, position: Position, move: int) -> int:
+        """
+        Returns most valuable victim - least valuable attacker score of the capture.
+        En passant captures a Pawn, promotions count as capturing the new piece.
+        """
+        board = position.board
+        victim = piece_type(board[mv.to_square(move)])
+        attacker = piece_type(board[mv.from_square(move)])
+        if mv.flag(move) == mv.EN_PASSANT:
+            victim = PAWN
+        return CAPTURE_SCORE + (victim + mv.promotion(move)) * 8 + KING - attacker
+
+    def order(self, position: Position, moves: list[int], hash_move: int, ply: int) -> list[int]:
+        """
+        Returns moves sorted from the most promising one
+        """
+        board = position.board
+        killers = self.killers[ply]
+        history = self.history
+        keys: list[int] = []
+        for move in moves:
+            if move == hash_move:
+                score = HASH_MOVE_SCORE
+            elif position.is_capture(move) or mv.promotion(move) == QUEEN:
+                score = self.capture_score(position, move)
+            elif move in killers:
+                score = KILLER_SCORES[killers.index(move)]
+            else:
+                score = history[board[mv.from_square(move)]][mv.to_square(move)]
+            keys.append(score << SCORE_SHIFT | move)
+        keys.sort(reverse=True)
+        return [key & MOVE_MASK for key in keys]
+
+    def update(self, position: Position, move: int, depth: int, ply: int) -> None:
+        """
+        Remembers the quiet move which caused a beta cutoff
+        """
+        if position.is_capture(move) or mv.promotion(move) == QUEEN:
+            return
+        killers = self.killers[ply]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        scores = self.history[position.board[mv.from_square(move)]]
+        to_sq = mv.to_square(move)
+        scores[to_sq] += depth * depth
+        if scores[to_sq] >= HISTORY_LIMIT:
+            for table in self.history:
+                for sq in range(64):
+                    table[sq] >>= 1
@@ -0,0 +1,269 @@
+"""
+Negamax alpha-beta search with iterative deepening on rules core positions
+"""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+from core import move as mv
+from core.position import Position
+from engine.evaluate import INFINITY, MATE_BOUND, MATE_SCORE, evaluate
+from engine.ordering import MoveOrdering
+from engine.see import see
+from engine.tt import EXACT, LOWER, UPPER, TranspositionTable
+
+MAX_DEPTH = 64
+# Limits are checked once per this many nodes, a few milliseconds of search
+CHECK_INTERVAL = 256
+# Helper workers of a parallel search skip some iterations, so they run ahead of the main one
+# at different depths. Helper n skips depth d when (d + SKIP_PHASE) // SKIP_SIZE is odd.
+SKIP_SIZE = (1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4)
+SKIP_PHASE = (0, 1, 0, 1, 2, 3, 0, 1, 2, 3, 4, 5, 0, 1, 2, 3, 4, 5, 6, 7)
+
+
+@dataclass
+class SearchLimits:
+    depth: int = MAX_DEPTH
+    nodes: int | None = None
+    time: float | None = None
+
+
+@dataclass
+class SearchResult:
+    move: int = mv.NULL_MOVE
+    score: int = 0
+    depth: int = 0
+    nodes: int = 0
+    time: float = 0.0
+
+    @property
+    def mate_in(self) -> int | None:
+        """
+        Returns moves to mate, negative if the side to move is mated, None if no mate is found
+        """
+        if abs(self.score) < MATE_BOUND:
+            return None
+        plies = MATE_SCORE - abs(self.score)
+        return (plies + 1) // 2 if self.score > 0 else -(plies // 2)
+
+
+class StopSignal(Protocol):
+    """
+    Event set from another thread or process to stop the search
+    """
+
+    def is_set(self) -> bool: ...
+
+
+class SearchAborted(Exception):
+    """
+    Raised inside the search tree when the node budget or time is exhausted or stop was requested
+    """
+
+
+class Searcher:
+    """
+    Class searching the best move of a Position.
+    Iterations go one ply deeper each time and the best move of the last one
+    is searched first, so an aborted iteration still returns a sound move.
+    Worker 0 is the main search, other workers are helpers of a parallel search.
+    """
+
+    def __init__(self, tt: TranspositionTable | None = None, worker: int = 0) -> None:
+        self.tt = TranspositionTable() if tt is None else tt
+        self.worker = worker
+        self.ordering = MoveOrdering()
+        self.nodes = 0
+        self.limits = SearchLimits()
+        self.start_time = 0.0
+        self.deadline: float | None = None
+        self.stop_event: StopSignal | None = None
+
+    def search(
+        self,
+        position: Position,
+        limits: SearchLimits,
+        on_iteration: Callable[[SearchResult], None] | None = None,
+        stop_event: StopSignal | None = None,
+    ) -> SearchResult:
+        """
+        Returns the best move found within the limits.
+        Callback is called with the result of every completed iteration.
+        Setting the stop event from another thread or process ends the search early.
+        """
+        self.nodes = 0
+        self.limits = limits
+        self.stop_event = stop_event
+        self.start_time = time.perf_counter()
+        self.deadline = None if limits.time is None else self.start_time + limits.time
+        self.tt.new_search()
+        self.ordering.new_search()
+
+        root_moves = position.legal_moves()
+        result = SearchResult()
+        if not root_moves:
+            return result
+        entry = self.tt.probe(position.key, 0)
+        root_moves = self.ordering.order(
+            position, root_moves, mv.NULL_MOVE if entry is None else entry[0], 0
+        )
+        result.move = root_moves[0]
+        root_ply = len(position.undo_stack)
+        for depth in range(1, min(limits.depth, MAX_DEPTH) + 1):
+            if self.skips_depth(depth):
+                continue
+            try:
+                score, move = self.search_root(position, root_moves, depth)
+            except SearchAborted:
+                # Abort leaves the moves of the current line made
+                while len(position.undo_stack) > root_ply:
+                    position.unmake_move()
+                break
+            result = SearchResult(move, score, depth, self.nodes, self.elapsed())
+            if on_iteration is not None:
+                on_iteration(result)
+            # Next iteration takes longer than all previous ones together
+            if limits.time is not None and self.elapsed() > limits.time / 2:
+                break
+            if abs(score) >= MATE_BOUND:
+                break
+        result.nodes = self.nodes
+        result.time = self.elapsed()
+        return result
+
+    def skips_depth(self, depth: int) -> bool:
+        if self.worker == 0:
+            return False
+        i = (self.worker - 1) % len(SKIP_SIZE)
+        return (depth + SKIP_PHASE[i]) // SKIP_SIZE[i] % 2 == 1
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start_time
+
+    def check_limits(self) -> None:
+        """
+        Raises SearchAborted if the node budget or time is exhausted or stop was requested
+        """
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise SearchAborted()
+        if self.limits.nodes is not None and self.nodes >= self.limits.nodes:
+            raise SearchAborted()
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchAborted()
+
+    def search_root(self, position: Position, root_moves: list[int], depth: int) -> tuple[int, int]:
+        """
+        Returns score and best move of the root position searched to the depth.
+        Best move is moved to the front of root moves for the next iteration.
+        """
+        alpha, beta = -INFINITY, INFINITY
+        best_move = root_moves[0]
+        for move in root_moves:
+            position.make_move(move)
+            score = -self.negamax(position, depth - 1, -beta, -alpha, 1)
+            position.unmake_move()
+            if score > alpha:
+                alpha = score
+                best_move = move
+        root_moves.remove(best_move)
+        root_moves.insert(0, best_move)
+        self.tt.store(position.key, best_move, alpha, depth, EXACT, 0)
+        return alpha, best_move
+
+    def negamax(self, position: Position, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """
+        Returns score of the position for the side to move within the alpha-beta window
+        """
+        self.nodes += 1
+        if self.nodes % CHECK_INTERVAL == 0:
+            self.check_limits()
+        if position.is_fifty_moves() or position.is_repetition(2):
+            return 0
+        if depth <= 0:
+            return self.quiescence(position, alpha, beta, ply)
+
+        hash_move = mv.NULL_MOVE
+        entry = self.tt.probe(position.key, ply)
+        if entry is not None:
+            hash_move, tt_score, tt_depth, bound = entry
+            if tt_depth >= depth and (
+                bound == EXACT
+                or (bound == LOWER and tt_score >= beta)
+                or (bound == UPPER and tt_score <= alpha)
+            ):
+                return tt_score
+
+        moves = position.legal_moves()
+        if not moves:
+            return -MATE_SCORE + ply if position.is_check() else 0
+        moves = self.ordering.order(position, moves, hash_move, ply)
+
+        original_alpha = alpha
+        best_score = -INFINITY
+        best_move = mv.NULL_MOVE
+        for move in moves:
+            position.make_move(move)
+            score = -self.negamax(position, depth - 1, -beta, -alpha, ply + 1)
+            position.unmake_move()
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if score >= beta:
+                        self.ordering.update(position, move, depth, ply)
+                        break
+
+        if best_score >= beta:
+            bound = LOWER
+        elif best_score > original_alpha:
+            bound = EXACT
+        else:
+            # No move raised alpha, so none of them is known to be best
+            bound = UPPER
+            best_move = mv.NULL_MOVE
+        self.tt.store(position.key, best_move, best_score, depth, bound, ply)
+        return best_score
+
+    def quiescence(self, position: Position, alpha: int, beta: int, ply: int) -> int:
+        """
+        Returns score of the position searching only captures and promotions,
+        so the static evaluation is never taken in the middle of an exchange.
+        Captures losing material by static exchange evaluation are skipped.
+        In check all evasions are searched, the side to move can't stand pat.
+        Stalemate is not detected here, standing pat is assumed to be possible.
+        """
+        self.nodes += 1
+        if self.nodes % CHECK_INTERVAL == 0:
+            self.check_limits()
+
+        if position.is_check():
+            moves = position.legal_moves()
+            if not moves:
+                return -MATE_SCORE + ply
+            best_score = -INFINITY
+        else:
+            # Side to move can stand pat with the static evaluation
+            best_score = evaluate(position)
+            if best_score >= beta:
+                return best_score
+            alpha = max(alpha, best_score)
+            moves = [
+                move
+                for move in position.legal_moves()
+                if (position.is_capture(move) or mv.promotion(move)) and see(position, move) >= 0
+            ]
+
+        for move in self.ordering.order(position, moves, mv.NULL_MOVE, ply):
+            position.make_move(move)
+            score = -self.quiescence(position, -beta, -alpha, ply + 1)
+            position.unmake_move()
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if score >= beta:
+                        break
+        return best_score
@@ -0,0 +1,65 @@
+"""
+Static exchange evaluation: material balance of the capture sequence on one square
+"""
+
+from core import move as mv
+from core.bitboard import BB_SQUARES
+from core.movegen import all_attackers
+from core.pieces import KING, PAWN, PIECE_TYPES, make_piece, piece_type
+from core.position import Position
+from core.squares import col_of, row_of, square
+from engine.evaluate import PIECE_VALUES
+
+# King can't be captured, it only ends the exchange
+SEE_VALUES = {**PIECE_VALUES, KING: 20_000}
+
+
+def see(position: Position, move: int) -> int:
+    """
+    Returns material gained by the move when both sides keep recapturing
+    on its destination with the least valuable attacker and may stop at any time.
+    Attackers are taken from the attack tables of both colors, pieces behind
+    a capturing slider join the exchange once it leaves the line.
+    """
+    from_sq = mv.from_square(move)
+    to_sq = mv.to_square(move)
+    board = position.board
+    bitboards = position.bitboards
+    occupied = position.occupied ^ BB_SQUARES[from_sq]
+
+    if mv.flag(move) == mv.EN_PASSANT:
+        victim_value = SEE_VALUES[PAWN]
+        occupied ^= BB_SQUARES[square(row_of(from_sq), col_of(to_sq))]
+    else:
+        victim_value = SEE_VALUES[piece_type(board[to_sq])] if board[to_sq] else 0
+    attacker_value = SEE_VALUES[piece_type(board[from_sq])]
+    if mv.promotion(move):
+        victim_value += SEE_VALUES[mv.promotion(move)] - SEE_VALUES[PAWN]
+        attacker_value = SEE_VALUES[mv.promotion(move)]
+
+    gains = [victim_value]
+    side = position.turn ^ 1
+    attackers = all_attackers(position, to_sq, occupied) & occupied
+    while True:
+        side_attackers = attackers & position.occupied_co[side]
+        if not side_attackers:
+            break
+        for ptype in PIECE_TYPES:
+            candidates = side_attackers & bitboards[make_piece(side, ptype)]
+            if candidates:
+                break
+        # Capturing piece stands to be captured next
+        gains.append(attacker_value - gains[-1])
+        if ptype == KING and attackers & position.occupied_co[side ^ 1] & ~candidates:
+            # King may not capture a defended piece
+            gains.pop()
+            break
+        attacker_value = SEE_VALUES[ptype]
+        occupied ^= candidates & -candidates
+        attackers = all_attackers(position, to_sq, occupied) & occupied
+        side ^= 1
+
+    # Each side picks the better of capturing and stopping, from the end of the sequence
+    for i in range(len(gains) - 1, 0, -1):
+        gains[i - 1] = -max(-gains[i - 1], gains[i])
+    return gains[0]
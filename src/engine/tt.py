@@ -0,0 +1,152 @@
+"""
+Transposition table of search results kept in one preallocated array of 64-bit words.
+"""
+
+from engine.evaluate import MATE_BOUND
+
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+DEFAULT_MEMORY_MB = 16
+# Two entries per bucket: depth-preferred and always-replace, two words per entry
+ENTRIES_PER_BUCKET = 2
+WORDS_PER_ENTRY = 2
+ENTRY_BYTES = WORDS_PER_ENTRY * 8
+
+# Data word layout
+MOVE_BITS = 17
+SCORE_SHIFT = MOVE_BITS
+SCORE_BITS = 20
+SCORE_OFFSET = 1 << (SCORE_BITS - 1)
+DEPTH_SHIFT = SCORE_SHIFT + SCORE_BITS
+DEPTH_BITS = 8
+BOUND_SHIFT = DEPTH_SHIFT + DEPTH_BITS
+BOUND_BITS = 2
+GENERATION_SHIFT = BOUND_SHIFT + BOUND_BITS
+GENERATION_BITS = 8
+
+
+def pack(move: int, score: int, depth: int, bound: int, generation: int) -> int:
+    """
+    Returns entry data packed into one 64-bit word
+    """
+    return (
+        move
+        | (score + SCORE_OFFSET) << SCORE_SHIFT
+        | depth << DEPTH_SHIFT
+        | bound << BOUND_SHIFT
+        | generation << GENERATION_SHIFT
+    )
+
+
+def score_to_table(score: int, ply: int) -> int:
+    """
+    Returns score with mate distance counted from the stored node instead of the root
+    """
+    if score >= MATE_BOUND:
+        return score + ply
+    if score <= -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def score_from_table(score: int, ply: int) -> int:
+    if score >= MATE_BOUND:
+        return score - ply
+    if score <= -MATE_BOUND:
+        return score + ply
+    return score
+
+
+class TranspositionTable:
+    """
+    Class storing depth, bound, score and best move of searched positions by Zobrist key.
+    Entries live in a flat array of 64-bit words, so the size is fixed at creation.
+    Every bucket has a depth-preferred entry, replaced only by deeper or newer results,
+    and an always-replace entry taking everything else.
+    Key word is stored xored with data word, so a torn write by another process
+    only looks like a miss.
+    """
+
+    def __init__(
+        self, memory_mb: int = DEFAULT_MEMORY_MB, buffer: memoryview | None = None
+    ) -> None:
+        if buffer is None:
+            buffer = memoryview(bytearray(self.size_in_bytes(memory_mb)))
+        self.bytes = buffer.cast("B")
+        self.words = self.bytes.cast("Q")
+        self.bucket_count = len(self.words) // (ENTRIES_PER_BUCKET * WORDS_PER_ENTRY)
+        self.mask = self.bucket_count - 1
+        self.generation = 0
+
+    @staticmethod
+    def size_in_bytes(memory_mb: int) -> int:
+        """
+        Returns the largest power of two number of bucket bytes within the memory limit
+        """
+        bucket_bytes = ENTRIES_PER_BUCKET * ENTRY_BYTES
+        bucket_count = max((memory_mb << 20) // bucket_bytes, 1)
+        return (1 << (bucket_count.bit_length() - 1)) * bucket_bytes
+
+    def clear(self) -> None:
+        self.bytes[:] = bytes(len(self.bytes))
+        self.generation = 0
+
+    def new_search(self) -> None:
+        """
+        Ages all stored entries, so the depth-preferred ones can be replaced
+        """
+        self.generation = (self.generation + 1) & ((1 << GENERATION_BITS) - 1)
+
+    def probe(self, key: int, ply: int) -> tuple[int, int, int, int] | None:
+        """
+        Returns move, score, depth and bound stored for the key or None
+        """
+        index = (key & self.mask) * ENTRIES_PER_BUCKET * WORDS_PER_ENTRY
+        words = self.words
+        for i in (index, index + WORDS_PER_ENTRY):
+            data = words[i + 1]
+            if words[i] ^ data != key:
+                continue
+            score = (data >> SCORE_SHIFT & ((1 << SCORE_BITS) - 1)) - SCORE_OFFSET
+            return (
+                data & ((1 << MOVE_BITS) - 1),
+                score_from_table(score, ply),
+                data >> DEPTH_SHIFT & ((1 << DEPTH_BITS) - 1),
+                data >> BOUND_SHIFT & ((1 << BOUND_BITS) - 1),
+            )
+        return None
+
+    def store(self, key: int, move: int, score: int, depth: int, bound: int, ply: int) -> None:
+        data = pack(move, score_to_table(score, ply), depth, bound, self.generation)
+        index = (key & self.mask) * ENTRIES_PER_BUCKET * WORDS_PER_ENTRY
+        words = self.words
+        stored = words[index + 1]
+        same_key = words[index] ^ stored == key
+        if not (
+            same_key
+            or depth >= stored >> DEPTH_SHIFT & ((1 << DEPTH_BITS) - 1)
+            or stored >> GENERATION_SHIFT != self.generation
+        ):
+            # Shallower result of another position doesn't evict the depth-preferred entry
+            index += WORDS_PER_ENTRY
+            stored = words[index + 1]
+            same_key = words[index] ^ stored == key
+        if move == 0 and same_key:
+            # Keep the best move found by an earlier search of the position
+            data |= stored & ((1 << MOVE_BITS) - 1)
+        words[index] = key ^ data
+        words[index + 1] = data
+
+    def hashfull(self) -> int:
+        """
+        Returns permille of the first thousand entries used in the current search
+        """
+        used = 0
+        sample = min(1000, self.bucket_count * ENTRIES_PER_BUCKET)
+        for i in range(sample):
+            data = self.words[i * WORDS_PER_ENTRY + 1]
+            if data and data >> GENERATION_SHIFT == self.generation:
+                used += 1
+        return used * 1000 // sample
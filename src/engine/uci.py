@@ -0,0 +1,233 @@
+"""
+UCI protocol front-end of the engine, talking to a chess GUI over text streams.
+Searches run in a SearchJob, so commands are read and answered while the engine thinks.
+"""
+
+import threading
+from typing import TextIO
+
+from core import move as mv
+from core.pieces import WHITE
+from core.position import Position
+from engine.book import OpeningBook
+from engine.job import EngineProcess, SearchJob
+from engine.search import MAX_DEPTH, SearchLimits, SearchResult
+from engine.tt import DEFAULT_MEMORY_MB
+
+ENGINE_NAME = "wolve265 chess"
+ENGINE_AUTHOR = "wolve265"
+
+MAX_HASH_MB = 4096
+MAX_WORKERS = 256
+# Clock time is split as if this many moves were left to play
+MOVES_TO_GO = 30
+# Reserve for the communication with the GUI, in seconds
+MOVE_OVERHEAD = 0.05
+
+
+def move_time(limits: dict[str, int], white: bool) -> float | None:
+    """
+    Returns search time in seconds for go command clock arguments in milliseconds
+    """
+    time_left = limits.get("wtime" if white else "btime")
+    if time_left is None:
+        return None
+    increment = limits.get("winc" if white else "binc", 0)
+    moves_to_go = limits.get("movestogo", MOVES_TO_GO)
+    budget = time_left / max(moves_to_go, 1) + increment * 3 / 4
+    # Never plan to use more than half of the clock on one move
+    budget = min(budget, time_left / 2) / 1000 - MOVE_OVERHEAD
+    return max(budget, 0.01)
+
+
+def info(result: SearchResult) -> str:
+    """
+    Returns UCI info line of the search iteration
+    """
+    mate_in = result.mate_in
+    score = f"mate {mate_in}" if mate_in is not None else f"cp {result.score}"
+    milliseconds = int(result.time * 1000)
+    nps = int(result.nodes / result.time) if result.time else 0
+    return (
+        f"info depth {result.depth} score {score} nodes {result.nodes} nps {nps} "
+        f"time {milliseconds} pv {mv.uci(result.move)}"
+    )
+
+
+class UciProtocol:
+    """
+    Class handling UCI commands read line by line from the input.
+    Search output is written by the search thread, so writes are serialized by a lock.
+    """
+
+    def __init__(self, commands: TextIO, output: TextIO) -> None:
+        self.commands = commands
+        self.output = output
+        self.lock = threading.Lock()
+        self.position = Position.initial()
+        self.memory_mb = DEFAULT_MEMORY_MB
+        self.workers = 1
+        self.engine: EngineProcess | None = None
+        self.job: SearchJob | None = None
+        # Best move of infinite analysis is held back until stop or quit
+        self.infinite = False
+        self.book: OpeningBook | None = None
+
+    def send(self, line: str) -> None:
+        with self.lock:
+            self.output.write(line + "\n")
+            self.output.flush()
+
+    def run(self) -> None:
+        """
+        Handles commands until quit or end of the input
+        """
+        try:
+            for line in self.commands:
+                if not self.handle(line):
+                    break
+        finally:
+            self.stop()
+            if self.engine is not None:
+                self.engine.close()
+            self.set_book("")
+
+    def handle(self, line: str) -> bool:
+        """
+        Handles one command, returns False on quit
+        """
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, args = tokens[0], tokens[1:]
+        if command == "quit":
+            return False
+        if command == "uci":
+            self.send(f"id name {ENGINE_NAME}")
+            self.send(f"id author {ENGINE_AUTHOR}")
+            self.send(
+                f"option name Hash type spin default {DEFAULT_MEMORY_MB} min 1 max {MAX_HASH_MB}"
+            )
+            self.send(f"option name Threads type spin default 1 min 1 max {MAX_WORKERS}")
+            self.send("option name BookFile type string default <empty>")
+            self.send("uciok")
+        elif command == "isready":
+            self.send("readyok")
+        elif command == "setoption":
+            self.set_option(args)
+        elif command == "ucinewgame":
+            self.stop()
+            if self.engine is not None:
+                self.engine.clear()
+        elif command == "position":
+            self.stop()
+            self.set_position(args)
+        elif command == "go":
+            self.stop()
+            self.go(args)
+        elif command == "stop":
+            self.stop()
+        else:
+            self.send(f"info string Unknown command: {command}")
+        return True
+
+    def set_option(self, args: list[str]) -> None:
+        """
+        Handles 'setoption name <name> value <value>', the engine restarts with new options
+        """
+        name, _, value = " ".join(args).removeprefix("name ").partition(" value ")
+        name = name.lower()
+        if name == "bookfile":
+            self.set_book(value)
+            return
+        try:
+            if name == "hash":
+                self.memory_mb = min(max(int(value), 1), MAX_HASH_MB)
+            elif name == "threads":
+                self.workers = min(max(int(value), 1), MAX_WORKERS)
+            else:
+                self.send(f"info string Unknown option: {name}")
+                return
+        except ValueError:
+            self.send(f"info string Invalid value: {value}")
+            return
+        self.stop()
+        if self.engine is not None:
+            self.engine.close()
+            self.engine = None
+
+    def set_book(self, path: str) -> None:
+        if self.book is not None:
+            self.book.close()
+            self.book = None
+        if path in ("", "<empty>"):
+            return
+        try:
+            self.book = OpeningBook(path)
+        except (OSError, ValueError) as error:
+            self.send(f"info string Book not loaded: {error}")
+
+    def set_position(self, args: list[str]) -> None:
+        """
+        Handles 'position startpos|fen <fen> [moves <move>...]'
+        """
+        moves_index = args.index("moves") if "moves" in args else len(args)
+        try:
+            if args and args[0] == "startpos":
+                position = Position.initial()
+            elif args and args[0] == "fen":
+                position = Position.from_fen(" ".join(args[1:moves_index]))
+            else:
+                raise ValueError("Expected startpos or fen")
+            # Moves keyword itself is skipped
+            for text in args[moves_index:][1:]:
+                position.make_move(position.parse_uci(text))
+        except ValueError as error:
+            self.send(f"info string {error}")
+            return
+        self.position = position
+
+    def go(self, args: list[str]) -> None:
+        """
+        Handles 'go' with depth, nodes, movetime, clock or infinite limits
+        and starts the search without waiting for it.
+        Book moves are played at once, except in infinite analysis.
+        """
+        self.infinite = "infinite" in args
+        book_move = None if self.book is None else self.book.choose(self.position)
+        if book_move is not None and not self.infinite:
+            self.send(f"bestmove {mv.uci(book_move)}")
+            return
+
+        values: dict[str, int] = {}
+        for name, value in zip(args, args[1:]):
+            if value.lstrip("-").isdigit():
+                values[name] = int(value)
+        limits = SearchLimits(depth=min(values.get("depth", MAX_DEPTH), MAX_DEPTH))
+        limits.nodes = values.get("nodes")
+        if "movetime" in values:
+            limits.time = max(values["movetime"] / 1000 - MOVE_OVERHEAD, 0.01)
+        elif not self.infinite:
+            limits.time = move_time(values, self.position.turn == WHITE)
+
+        if self.engine is None:
+            self.engine = EngineProcess(self.memory_mb, self.workers)
+        self.job = SearchJob(
+            self.engine, self.position, limits, self.on_done, lambda result: self.send(info(result))
+        )
+        self.job.start()
+
+    def on_done(self, job: SearchJob, result: SearchResult) -> None:
+        # Search ends by itself on a mate or at the maximum depth, infinite analysis must not
+        if not self.infinite:
+            self.send(f"bestmove {mv.uci(result.move)}")
+
+    def stop(self) -> None:
+        """
+        Stops the running search, its best move is sent before this returns
+        """
+        if self.job is not None:
+            self.job.cancel()
+            if self.infinite and self.job.result is not None:
+                self.send(f"bestmove {mv.uci(self.job.result.move)}")
+            self.job = None
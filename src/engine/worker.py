@@ -0,0 +1,27 @@
+"""
+Engine of a pool worker process, created once and reused by all tasks of the process.
+"""
+
+from engine.search import Searcher
+from engine.tt import TranspositionTable
+
+# Engine of the worker process, created by the pool initializer
+_searcher: Searcher | None = None
+
+
+def init_worker(memory_mb: int) -> None:
+    """
+    Pool initializer creating the engine of the worker process
+    """
+    global _searcher
+    _searcher = Searcher(TranspositionTable(memory_mb))
+
+
+def worker_searcher(memory_mb: int) -> Searcher:
+    """
+    Returns the engine of the worker process, created with the hash size when called outside a pool
+    """
+    if _searcher is None:
+        init_worker(memory_mb)
+    assert _searcher is not None
+    return _searcher
@@ -7,6 +7,8 @@ MAIN_MENU = pg.event.custom_type()
 START_GAME = pg.event.custom_type()
 END_GAME = pg.event.custom_type()
 END_APP = pg.event.custom_type()
+# ENGINE_MOVE carries the move found by the engine process
+ENGINE_MOVE = pg.event.custom_type()
 
 
 def gen_event(event: int) -> None:
@@ -1,44 +1,9 @@
 import sys
-from dataclasses import dataclass
-from enum import Enum, auto
 
 import pygame as pg
-from pygame.sprite import AbstractGroup
 
 from settings import Settings
-
-
-class Player(Enum):
-    WHITE = 1
-    BLACK = 0
-
-    def __str__(self) -> str:
-        return f"Player {self.name.capitalize()}"
-
-    def opponent(self) -> "Player":
-        return Player(not self.value)
-
-
-class Action(Enum):
-    SELECT = auto()
-    MOVE = auto()
-    END_TURN = auto()
-
-
-@dataclass
-class State:
-    player: Player = Player.BLACK
-    action: Action = Action.SELECT
-    short_castle: bool = False
-    long_castle: bool = False
-    capture: bool = False
-    check: bool = False
-    checkmate: bool = False
-    stalemate: bool = False
-
-    @property
-    def end(self) -> bool:
-        return self.checkmate or self.stalemate
+from state import Player, State
 
 
 class Game:
@@ -55,11 +20,6 @@ class Game:
         self.state = State()
         self.counter = -1
         self.turn_counter = 0
-        self.squares = AbstractGroup()
-        self.pieces = AbstractGroup()
-        self.king_attackers = AbstractGroup()
-        self.squares_between_king_and_attacker = AbstractGroup()
-        self.is_knight_king_attacker = False
 
     def setup(self) -> None:
         """
@@ -92,7 +52,14 @@ class Game:
         """
         Prints end game result
         """
-        sys.stdout.write(f"\n{self.state.player} won")
+        if self.state.checkmate:
+            sys.stdout.write(f"\n{self.state.player} won")
+        elif self.state.stalemate:
+            sys.stdout.write("\nDraw by stalemate")
+        elif self.state.threefold_repetition:
+            sys.stdout.write("\nDraw by threefold repetition")
+        elif self.state.fifty_moves:
+            sys.stdout.write("\nDraw by fifty-move rule")
 
 
 game = Game()
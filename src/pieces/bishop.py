@@ -1,4 +1,4 @@
-from board.coord import Coord
+from core.pieces import BISHOP
 from pieces.piece import Piece
 
 
@@ -7,5 +7,4 @@ class Bishop(Piece):
     Class representing the Bishop piece
     """
 
-    move_range = 8
-    directions = {Coord(1, 1), Coord(-1, 1), Coord(-1, -1), Coord(1, -1)}
+    piece_type = BISHOP
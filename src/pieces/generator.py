@@ -1,6 +1,8 @@
 from board.col import Col
 from board.coord import Coord
 from board.row import Row
+from core.pieces import EMPTY, WHITE, piece_color, piece_type
+from core.position import Position
 from pieces.bishop import Bishop
 from pieces.king import King
 from pieces.knight import Knight
@@ -8,7 +10,10 @@ from pieces.pawn import Pawn
 from pieces.piece import Piece
 from pieces.queen import Queen
 from pieces.rook import Rook
-from settings import Settings
+
+PIECE_CLASSES: dict[int, type[Piece]] = {
+    cls.piece_type: cls for cls in (Pawn, Knight, Bishop, Rook, Queen, King)
+}
 
 
 class Generator:
@@ -20,33 +25,18 @@ class Generator:
         self.rows = rows
         self.cols = cols
 
-    def run(self) -> list[Piece]:
+    def run(self, position: Position) -> list[Piece]:
+        """
+        Generates Piece sprites for every piece of the position
+        """
         pieces: list[Piece] = []
-
-        # Pawns
-        for row_i, is_white in zip((1, 6), (True, False)):
-            for col_i in range(Settings.COL_NUM):
-                pieces.append(
-                    Pawn(Coord(row_i, col_i), is_white, self.rows[row_i], self.cols[col_i])
-                )
-
-        # Rooks, Knights, Bishops, Queens, Kings
-        for row_i, is_white in zip((0, 7), (True, False)):
-            for col_i in (0, 7):
-                pieces.append(
-                    Rook(Coord(row_i, col_i), is_white, self.rows[row_i], self.cols[col_i])
-                )
-            for col_i in (1, 6):
-                pieces.append(
-                    Knight(Coord(row_i, col_i), is_white, self.rows[row_i], self.cols[col_i])
-                )
-            for col_i in (2, 5):
-                pieces.append(
-                    Bishop(Coord(row_i, col_i), is_white, self.rows[row_i], self.cols[col_i])
-                )
-            col_i = 3
-            pieces.append(Queen(Coord(row_i, col_i), is_white, self.rows[row_i], self.cols[col_i]))
-            col_i = 4
-            pieces.append(King(Coord(row_i, col_i), is_white, self.rows[row_i], self.cols[col_i]))
-
+        for index, piece in enumerate(position.board):
+            if piece == EMPTY:
+                continue
+            coord = Coord.from_index(index)
+            piece_cls = PIECE_CLASSES[piece_type(piece)]
+            is_white = piece_color(piece) == WHITE
+            pieces.append(
+                piece_cls(coord, is_white, self.rows[coord.row_i], self.cols[coord.col_i])
+            )
         return pieces
@@ -1,6 +1,7 @@
 from pygame.sprite import AbstractGroup
 
 from board.coord import Coord
+from core.pieces import KNIGHT
 from pieces.piece import Piece
 
 
@@ -9,17 +10,7 @@ class Knight(Piece):
     Class representing the Knight piece
     """
 
-    move_range = 1
-    directions = {
-        Coord(2, 1),
-        Coord(1, 2),
-        Coord(-1, 2),
-        Coord(-2, 1),
-        Coord(-2, -1),
-        Coord(-1, -2),
-        Coord(1, -2),
-        Coord(2, -1),
-    }
+    piece_type = KNIGHT
 
     def __init__(self, coord: Coord, is_white: bool, *groups: AbstractGroup) -> None:
         super().__init__(coord, is_white, *groups)
@@ -26,11 +26,3 @@ class WhiteCaptures(Moves):
 
 class BlackCaptures(Moves):
     ...
-
-
-class WhiteDefendedSquares(Moves):
-    ...
-
-
-class BlackDefendedSquares(Moves):
-    ...
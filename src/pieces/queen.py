@@ -1,4 +1,4 @@
-from board.coord import Coord
+from core.pieces import QUEEN
 from pieces.piece import Piece
 
 
@@ -7,14 +7,4 @@ class Queen(Piece):
     Class representing the Queen piece
     """
 
-    move_range = 8
-    directions = {
-        Coord(1, 0),
-        Coord(1, 1),
-        Coord(0, 1),
-        Coord(-1, 1),
-        Coord(-1, 0),
-        Coord(-1, -1),
-        Coord(0, -1),
-        Coord(1, -1),
-    }
+    piece_type = QUEEN
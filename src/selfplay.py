@@ -0,0 +1,219 @@
+"""
+Headless self-play: games between engine and random players in a process pool.
+Every worker process has its own rules core and engine, no window is opened.
+"""
+
+import multiprocessing as mp
+import random
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from core import move as mv
+from core.notation import san
+from core.pgn import PgnGame
+from core.pieces import WHITE
+from core.position import Position
+from engine.search import SearchLimits
+from engine.worker import init_worker, worker_searcher
+from state import Player, State
+
+ENGINE = "engine"
+RANDOM = "random"
+PLAYERS = (ENGINE, RANDOM)
+
+# Games longer than this are adjudicated as draws
+MAX_PLIES = 400
+# Transposition table of every worker, games are short and tables are cleared per game
+WORKER_HASH_MB = 4
+
+
+@dataclass
+class GameSpec:
+    """
+    Players and settings of one game, sent to a worker
+    """
+
+    index: int
+    white: str
+    black: str
+    # Kind of every player by name, ENGINE or RANDOM
+    kinds: dict[str, str]
+    limits: SearchLimits
+    seed: int
+    # Random moves played before the players take over, so engine games differ
+    opening_plies: int = 0
+    max_plies: int = MAX_PLIES
+
+
+@dataclass
+class GameRecord:
+    """
+    Outcome of one game, sent back by a worker
+    """
+
+    index: int
+    white: str
+    black: str
+    result: str
+    state: State
+    moves: list[str] = field(default_factory=list)
+    # Thinking time in seconds of every move chosen by the players, random opening excluded
+    white_times: list[float] = field(default_factory=list)
+    black_times: list[float] = field(default_factory=list)
+    adjudicated: bool = False
+
+    def pgn_game(self) -> PgnGame:
+        tags = {
+            "Event": "Self-play",
+            "Site": "?",
+            "Date": "????.??.??",
+            "Round": str(self.index + 1),
+            "White": self.white,
+            "Black": self.black,
+        }
+        return PgnGame(tags, self.moves, self.result)
+
+
+def final_state(position: Position, move: int, legal_moves: list[int]) -> State:
+    """
+    Returns State after the move, with the same flags the Board sets at the end of a turn.
+    Player is the one who made the move.
+    """
+    state = State(player=Player(position.turn ^ 1))
+    if mv.flag(move) == mv.CASTLING:
+        state.short_castle = mv.to_square(move) > mv.from_square(move)
+        state.long_castle = not state.short_castle
+    state.update_end(position, legal_moves)
+    return state
+
+
+def play_game(spec: GameSpec) -> GameRecord:
+    """
+    Plays one game of the spec from the starting position
+    """
+    rng = random.Random(spec.seed)
+    searcher = worker_searcher(WORKER_HASH_MB)
+    searcher.tt.clear()
+    position = Position.initial()
+    record = GameRecord(spec.index, spec.white, spec.black, "*", State())
+    legal_moves = position.legal_moves()
+    move = mv.NULL_MOVE
+    capture = False
+    while legal_moves:
+        ply = len(position.undo_stack)
+        if ply >= spec.max_plies:
+            record.adjudicated = True
+            break
+        if ply < spec.opening_plies:
+            move = rng.choice(legal_moves)
+        else:
+            player = spec.white if position.turn == WHITE else spec.black
+            start = time.perf_counter()
+            if spec.kinds[player] == RANDOM:
+                move = rng.choice(legal_moves)
+            else:
+                move = searcher.search(position, spec.limits).move
+            times = record.white_times if position.turn == WHITE else record.black_times
+            times.append(time.perf_counter() - start)
+        record.moves.append(san(position, move, legal_moves))
+        capture = position.is_capture(move)
+        position.make_move(move)
+        legal_moves = position.legal_moves()
+        if position.is_repetition() or position.is_fifty_moves():
+            break
+
+    if move != mv.NULL_MOVE:
+        record.state = final_state(position, move, legal_moves)
+        record.state.capture = capture
+    record.result = "1/2-1/2" if record.adjudicated else record.state.result
+    return record
+
+
+def play_games(
+    specs: Iterable[GameSpec], processes: int | None = None, memory_mb: int = WORKER_HASH_MB
+) -> Iterator[GameRecord]:
+    """
+    Yields records of the games in order of completion, played by a pool of processes
+    """
+    with mp.Pool(processes, initializer=init_worker, initargs=(memory_mb,)) as pool:
+        yield from pool.imap_unordered(play_game, specs)
+
+
+@dataclass
+class PlayerStats:
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    moves: int = 0
+    time: float = 0.0
+
+    @property
+    def score(self) -> float:
+        games = self.wins + self.draws + self.losses
+        return (self.wins + self.draws / 2) / games if games else 0.0
+
+
+@dataclass
+class TournamentReport:
+    """
+    Aggregate statistics of the played games, players are counted per name
+    """
+
+    games: int = 0
+    plies: int = 0
+    elapsed: float = 0.0
+    players: dict[str, PlayerStats] = field(default_factory=dict)
+    # Game endings by reason, e.g. checkmate or threefold_repetition
+    endings: dict[str, int] = field(default_factory=dict)
+
+    def add(self, record: GameRecord) -> None:
+        self.games += 1
+        self.plies += len(record.moves)
+        white = self.players.setdefault(record.white, PlayerStats())
+        black = self.players.setdefault(record.black, PlayerStats())
+        if record.result == "1-0":
+            white.wins += 1
+            black.losses += 1
+        elif record.result == "0-1":
+            white.losses += 1
+            black.wins += 1
+        else:
+            white.draws += 1
+            black.draws += 1
+        white.moves += len(record.white_times)
+        white.time += sum(record.white_times)
+        black.moves += len(record.black_times)
+        black.time += sum(record.black_times)
+        reason = ending(record)
+        self.endings[reason] = self.endings.get(reason, 0) + 1
+
+    def lines(self) -> list[str]:
+        """
+        Returns the report as text lines
+        """
+        lines = [f"Games: {self.games}"]
+        for name, stats in sorted(self.players.items()):
+            per_move = stats.time / stats.moves * 1000 if stats.moves else 0
+            lines.append(
+                f"{name}: +{stats.wins} ={stats.draws} -{stats.losses} "
+                f"score {stats.score:.1%}, {per_move:.1f} ms/move"
+            )
+        for reason, count in sorted(self.endings.items()):
+            lines.append(f"{reason}: {count}")
+        lines.append(f"Moves/game: {self.plies / self.games if self.games else 0:.1f}")
+        lines.append(f"Time: {self.elapsed:.3f} s")
+        lines.append(f"Games/s: {self.games / self.elapsed if self.elapsed else 0:.2f}")
+        return lines
+
+
+def ending(record: GameRecord) -> str:
+    """
+    Returns the reason the game ended
+    """
+    if record.adjudicated:
+        return "adjudicated"
+    for reason in ("checkmate", "stalemate", "threefold_repetition", "fifty_moves"):
+        if getattr(record.state, reason):
+            return reason
+    return "unfinished"
@@ -53,3 +53,22 @@ class Settings:
     POPUP_TEXT_MARGIN: int = 25
     POPUP_SPACING: int = 25
     POPUP_BORDER_RADIUS: int = 10
+
+    # Engine
+    ENGINE_PLAYS_WHITE: bool = False
+    ENGINE_PLAYS_BLACK: bool = False
+    # Search time of the engine per move in seconds
+    ENGINE_MOVE_TIME: float = 1.0
+    # Memory limit of the transposition table in megabytes
+    ENGINE_HASH_MB: int = 64
+    # Number of processes searching in parallel, each one uses a CPU core
+    ENGINE_WORKERS: int = 1
+    # Polyglot opening book the engine plays from while in book, empty path disables it
+    ENGINE_BOOK_PATH: str = ""
+
+    # PGN
+    PGN_EVENT: str = "Casual game"
+    PGN_WHITE_PLAYER: str = "?"
+    PGN_BLACK_PLAYER: str = "?"
+    # Every finished game is appended to this file, empty path disables the archive
+    PGN_ARCHIVE_PATH: str = ""
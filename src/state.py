@@ -0,0 +1,72 @@
+"""
+Game state shared by the window and the headless runners, it doesn't depend on pygame
+"""
+
+from dataclasses import dataclass
+from enum import Enum, auto
+
+from core.position import Position
+
+
+class Player(Enum):
+    WHITE = 1
+    BLACK = 0
+
+    def __str__(self) -> str:
+        return f"Player {self.name.capitalize()}"
+
+    def opponent(self) -> "Player":
+        return Player(not self.value)
+
+
+class Action(Enum):
+    SELECT = auto()
+    MOVE = auto()
+    END_TURN = auto()
+
+
+@dataclass
+class State:
+    player: Player = Player.BLACK
+    action: Action = Action.SELECT
+    short_castle: bool = False
+    long_castle: bool = False
+    capture: bool = False
+    check: bool = False
+    checkmate: bool = False
+    stalemate: bool = False
+    threefold_repetition: bool = False
+    fifty_moves: bool = False
+
+    def update_end(self, position: Position, legal_moves: list[int]) -> None:
+        """
+        Sets check, checkmate and draw flags of the position with its legal moves,
+        the same way for the window and the headless runners
+        """
+        self.check = position.is_check()
+        self.checkmate = self.check and not legal_moves
+        self.stalemate = not self.check and not legal_moves
+        if self.checkmate:
+            return
+        self.threefold_repetition = position.is_repetition()
+        self.fifty_moves = position.is_fifty_moves()
+
+    @property
+    def draw(self) -> bool:
+        return self.stalemate or self.threefold_repetition or self.fifty_moves
+
+    @property
+    def end(self) -> bool:
+        return self.checkmate or self.draw
+
+    @property
+    def result(self) -> str:
+        """
+        Returns game result in PGN notation.
+        After checkmate the player is the one who gave it.
+        """
+        if self.checkmate:
+            return "1-0" if self.player == Player.WHITE else "0-1"
+        if self.draw:
+            return "1/2-1/2"
+        return "*"
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modules of the app are imported from src, as by the entry point scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
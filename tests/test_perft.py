@@ -0,0 +1,19 @@
+import pytest
+
+from core.fen import STARTING_FEN
+from core.perft import perft
+from core.position import Position
+
+# Published leaf node counts of the standard perft positions
+POSITIONS = [
+    (STARTING_FEN, 4, 197281),
+    ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", 3, 97862),
+    ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 5, 674624),
+    ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", 3, 9467),
+    ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", 3, 62379),
+]
+
+
+@pytest.mark.parametrize("fen, depth, nodes", POSITIONS)
+def test_perft(fen: str, depth: int, nodes: int) -> None:
+    assert perft(Position.from_fen(fen), depth) == nodes
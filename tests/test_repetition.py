@@ -0,0 +1,27 @@
+from core.notation import parse_san
+from core.position import Position
+
+
+def play(position: Position, moves: str) -> None:
+    for text in moves.split():
+        position.make_move(parse_san(position, text))
+
+
+def test_repetition_after_unusable_double_push() -> None:
+    """
+    First occurrence follows a double push nobody can capture, it still counts
+    """
+    position = Position.initial()
+    play(position, "e4 Nf6 Nf3 Ng8 Ng1 Nf6 Nf3 Ng8")
+    assert not position.is_repetition()
+    play(position, "Ng1")
+    assert position.is_repetition()
+
+
+def test_capturable_double_push_is_a_different_position() -> None:
+    position = Position.from_fen("4k3/8/8/8/5p2/8/4P3/4K3 w - - 0 1")
+    play(position, "e4 Kd7 Kd2 Ke8 Ke1 Kd7 Kd2 Ke8 Ke1")
+    # Position after e4 could be answered by fxe3, later ones can't
+    assert not position.is_repetition()
+    play(position, "Kd7 Kd2 Ke8 Ke1")
+    assert position.is_repetition()
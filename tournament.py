@@ -0,0 +1,82 @@
+import argparse
+import sys
+import time
+
+sys.path.insert(0, "src")
+from core.pgn import PgnWriter  # noqa: E402
+from engine.search import SearchLimits  # noqa: E402
+from selfplay import (  # noqa: E402
+    MAX_PLIES,
+    PLAYERS,
+    WORKER_HASH_MB,
+    GameSpec,
+    TournamentReport,
+    play_games,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Plays engine and random players against each other without a window"
+    )
+    parser.add_argument("games", type=int, help="number of games")
+    parser.add_argument("--player1", choices=PLAYERS, default="engine")
+    parser.add_argument("--player2", choices=PLAYERS, default="random")
+    parser.add_argument("--depth", type=int, default=2, help="engine search depth")
+    parser.add_argument("--nodes", type=int, help="engine node limit per move")
+    parser.add_argument("--movetime", type=float, help="engine time limit per move in seconds")
+    parser.add_argument("--hash", type=int, default=WORKER_HASH_MB, help="hash size in MB")
+    parser.add_argument("--processes", type=int, help="worker processes, CPU count by default")
+    parser.add_argument(
+        "--opening-plies", type=int, default=4, help="random moves played at the start"
+    )
+    parser.add_argument("--max-plies", type=int, default=MAX_PLIES, help="draw adjudication")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random moves")
+    parser.add_argument("--pgn", help="PGN file the games are written to")
+    args = parser.parse_args()
+    if args.games < 1:
+        parser.error("games must be at least 1")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    limits = SearchLimits(depth=args.depth, nodes=args.nodes, time=args.movetime)
+    player1 = f"{args.player1} 1"
+    player2 = f"{args.player2} 2"
+    kinds = {player1: args.player1, player2: args.player2}
+    # Players swap colors every game
+    specs = [
+        GameSpec(
+            index,
+            player1 if index % 2 == 0 else player2,
+            player2 if index % 2 == 0 else player1,
+            kinds,
+            limits,
+            args.seed + index,
+            args.opening_plies,
+            args.max_plies,
+        )
+        for index in range(args.games)
+    ]
+
+    report = TournamentReport()
+    records = []
+    start = time.perf_counter()
+    for record in play_games(specs, args.processes, args.hash):
+        report.add(record)
+        records.append(record)
+    report.elapsed = time.perf_counter() - start
+
+    if args.pgn:
+        records.sort(key=lambda record: record.index)
+        with PgnWriter(args.pgn, append=False) as writer:
+            writer.write_games(record.pgn_game() for record in records)
+    sys.stdout.write("\n".join(report.lines()) + "\n")
+
+
+if __name__ == "__main__":
+    if sys.version_info < (3, 10):
+        print("This chess app requires Python 3.10 or newer.")
+        sys.exit(1)
+    main()
@@ -0,0 +1,51 @@
+import argparse
+import sys
+import time
+
+sys.path.insert(0, "src")
+from core.pgn import read_games, replay  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Replays every game of PGN archives and reports illegal moves"
+    )
+    parser.add_argument("paths", nargs="+", help="PGN files")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    games = 0
+    invalid = 0
+    plies = 0
+    start = time.perf_counter()
+    for path in args.paths:
+        with open(path, encoding="utf-8-sig", errors="replace") as file:
+            for game in read_games(file):
+                games += 1
+                try:
+                    plies += len(replay(game).undo_stack)
+                except ValueError as error:
+                    invalid += 1
+                    white = game.tags.get("White", "?")
+                    black = game.tags.get("Black", "?")
+                    sys.stdout.write(
+                        f"{path}:{game.line_number}: game {games} ({white} - {black}): {error}\n"
+                    )
+    elapsed = time.perf_counter() - start
+
+    sys.stdout.write(f"\nGames: {games}\n")
+    sys.stdout.write(f"Invalid: {invalid}\n")
+    sys.stdout.write(f"Plies: {plies}\n")
+    sys.stdout.write(f"Time: {elapsed:.3f} s\n")
+    sys.stdout.write(f"Games/s: {games / elapsed if elapsed else 0:.0f}\n")
+    if invalid:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    if sys.version_info < (3, 10):
+        print("This chess app requires Python 3.10 or newer.")
+        sys.exit(1)
+    main()